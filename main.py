@@ -17,16 +17,26 @@ Author: Generated for Dong's Japanese learning project
 import os
 import sys
 import json
+import atexit
 import hashlib
+import functools
+import itertools
+import collections
 import unicodedata
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Tuple, Any
+from dataclasses import dataclass, replace, asdict
+from typing import List, Optional, Dict, Tuple, Any, Iterable
 import re
+import threading
+import queue
+import io
+import sqlite3
 import zipfile
 import urllib.request
 import urllib.parse
 import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 # Third-party imports (install via pip)
 try:
@@ -43,6 +53,21 @@ except ImportError:
     os.system("pip install beautifulsoup4 --break-system-packages")
     from bs4 import BeautifulSoup
 
+# lxml (C) parser for BeautifulSoup when available - much faster than html.parser
+try:
+    from lxml import etree as lxml_etree
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    lxml_etree = None
+    HTML_PARSER = "html.parser"
+
+# Optional: selectolax (lexbor) replaces BeautifulSoup for EPUB parsing entirely
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 try:
     import requests
 except ImportError:
@@ -50,13 +75,95 @@ except ImportError:
     os.system("pip install requests --break-system-packages")
     import requests
 
+logger = logging.getLogger("anki_generator")
+
+# Optional: faster JSON (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = False) -> str:
+    """Serialize to JSON text, keeping non-ASCII as-is"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+def _json_dumpb(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (no str round-trip with orjson)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return _json_dumps(obj, indent).encode("utf-8")
+
+
+def _json_dump(obj, f, indent: bool = False):
+    f.write(_json_dumps(obj, indent))
+
+
+# CJK Unified Ideographs - the "is kanji" range used throughout
+_KANJI_RE = re.compile(r"[\u4e00-\u9fff]")
+
+# "Japanese → Vietnamese" separator in example sentences (spaces included)
+_ARROW_RE = re.compile(r"\s*[→⇒]\s*")
+
+
+def _build_trie(mapping: Dict[str, str]) -> Dict:
+    """Nested char dict of mapping's keys; a node's "" key holds the value"""
+    trie: Dict = {}
+    for key, value in mapping.items():
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[""] = value
+    return trie
+
+
+class _DropUnmapped(dict):
+    """str.translate table that deletes every character it has no entry for"""
+
+    __slots__ = ()
+
+    def __missing__(self, key):
+        return None
+
+
+@functools.lru_cache(maxsize=16384)
+def _cache_name(word: str) -> str:
+    """md5-based name of a word's per-API cache file (shared by every API)"""
+    return hashlib.md5(word.encode()).hexdigest()[:12]
+
+
+@functools.lru_cache(maxsize=16384)
+def _short_hash(s: str, n: int) -> str:
+    """md5-based media filename stem (cached, same word recurs often)"""
+    return hashlib.md5(s.encode()).hexdigest()[:n]
+
+
+class _ThreadFlag(threading.local):
+    """Per-thread bool: "did this thread's last lookup hit the network?"
+
+    The enrichment workers share the API classes, so a plain class attribute
+    could be flipped by another thread between a lookup and its check.
+    """
+
+    value = False
+
 
 # =============================================================================
 # DATA STRUCTURES
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class VocabEntry:
     """Represents a single vocabulary entry"""
 
@@ -70,12 +177,9 @@ class VocabEntry:
     pitch_svg: str = ""  # SVG diagram for pitch
     stroke_order_svg: str = ""  # Stroke order diagram
     audio_file: str = ""  # Path to audio file
-    example_sentences: List[str] = field(default_factory=list)
     radical_info: str = ""  # Bộ thủ information
-    kanji_origin: str = ""  # Etymology/origin
     chapter: str = ""  # Source chapter
     sub_category: str = ""  # Sub-category within chapter
-    takoboto_link: str = ""  # Takoboto dictionary link
     examples: str = ""  # Example sentences HTML
     # Kanji detail fields
     kanji_pinyin: str = ""  # Chinese pinyin
@@ -92,13 +196,6 @@ class VocabEntry:
     synonyms: str = ""  # Similar words
     antonyms: str = ""  # Opposite words
 
-    def generate_takoboto_link(self):
-        """Generate Takoboto dictionary link - web URL that opens app if installed"""
-        encoded = urllib.parse.quote(self.word)
-        # Simple web URL - Android will offer to open in Takoboto app if installed
-        self.takoboto_link = f"https://takoboto.jp/?q={encoded}"
-        return self.takoboto_link
-
 
 # =============================================================================
 # EPUB PARSER
@@ -108,6 +205,144 @@ class VocabEntry:
 class EPUBVocabParser:
     """Parse vocabulary from EPUB file"""
 
+    # Romaji -> hiragana (simplified, see _romaji_to_hiragana)
+    ROMAJI_MAP = {
+        "a": "あ",
+        "i": "い",
+        "u": "う",
+        "e": "え",
+        "o": "お",
+        "ka": "か",
+        "ki": "き",
+        "ku": "く",
+        "ke": "け",
+        "ko": "こ",
+        "sa": "さ",
+        "shi": "し",
+        "su": "す",
+        "se": "せ",
+        "so": "そ",
+        "ta": "た",
+        "chi": "ち",
+        "tsu": "つ",
+        "te": "て",
+        "to": "と",
+        "na": "な",
+        "ni": "に",
+        "nu": "ぬ",
+        "ne": "ね",
+        "no": "の",
+        "ha": "は",
+        "hi": "ひ",
+        "fu": "ふ",
+        "he": "へ",
+        "ho": "ほ",
+        "ma": "ま",
+        "mi": "み",
+        "mu": "む",
+        "me": "め",
+        "mo": "も",
+        "ya": "や",
+        "yu": "ゆ",
+        "yo": "よ",
+        "ra": "ら",
+        "ri": "り",
+        "ru": "る",
+        "re": "れ",
+        "ro": "ろ",
+        "wa": "わ",
+        "wo": "を",
+        "n": "ん",
+        "ga": "が",
+        "gi": "ぎ",
+        "gu": "ぐ",
+        "ge": "げ",
+        "go": "ご",
+        "za": "ざ",
+        "ji": "じ",
+        "zu": "ず",
+        "ze": "ぜ",
+        "zo": "ぞ",
+        "da": "だ",
+        "di": "ぢ",
+        "du": "づ",
+        "de": "で",
+        "do": "ど",
+        "ba": "ば",
+        "bi": "び",
+        "bu": "ぶ",
+        "be": "べ",
+        "bo": "ぼ",
+        "pa": "ぱ",
+        "pi": "ぴ",
+        "pu": "ぷ",
+        "pe": "ぺ",
+        "po": "ぽ",
+        "kya": "きゃ",
+        "kyu": "きゅ",
+        "kyo": "きょ",
+        "sha": "しゃ",
+        "shu": "しゅ",
+        "sho": "しょ",
+        "cha": "ちゃ",
+        "chu": "ちゅ",
+        "cho": "ちょ",
+        "nya": "にゃ",
+        "nyu": "にゅ",
+        "nyo": "にょ",
+        "hya": "ひゃ",
+        "hyu": "ひゅ",
+        "hyo": "ひょ",
+        "mya": "みゃ",
+        "myu": "みゅ",
+        "myo": "みょ",
+        "rya": "りゃ",
+        "ryu": "りゅ",
+        "ryo": "りょ",
+        "gya": "ぎゃ",
+        "gyu": "ぎゅ",
+        "gyo": "ぎょ",
+        "ja": "じゃ",
+        "ju": "じゅ",
+        "jo": "じょ",
+        "bya": "びゃ",
+        "byu": "びゅ",
+        "byo": "びょ",
+        "pya": "ぴゃ",
+        "pyu": "ぴゅ",
+        "pyo": "ぴょ",
+        # Long vowels
+        "ā": "ああ",
+        "ī": "いい",
+        "ū": "うう",
+        "ē": "ええ",
+        "ō": "おお",
+    }
+    # Character trie over the keys: one left-to-right walk, longest match wins
+    _ROMAJI_TRIE = _build_trie(ROMAJI_MAP)
+
+    # Hiragana 3040-309F, Katakana 30A0-30FF, Kanji 4E00-9FFF (+ 々 to keep)
+    _NON_JAPANESE_RE = re.compile(r"[^\u3040-\u30ff\u4e00-\u9fff々]+")
+    _JAPANESE_RE = re.compile(r"[\u3040-\u30ff\u4e00-\u9fff]+")
+
+    _SPAN_SELECTORS = ("span.top_trans", "span.top_word", "span.top_post")
+    # Compiled once: string value of the first span with each class (lxml path)
+    _SPAN_XPATHS = (
+        tuple(
+            lxml_etree.XPath(
+                "string(.//span[contains(concat(' ', normalize-space(@class), ' '),"
+                f" ' {cls_name} ')][1])"
+            )
+            for cls_name in ("top_trans", "top_word", "top_post")
+        )
+        if lxml_etree is not None
+        else ()
+    )
+
+    # Below this much chapter HTML, pool start-up + pickling costs more than
+    # parsing in-process (a typical book is ~1.5 MB, well under a second)
+    PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
     def __init__(self, epub_path: str):
         self.epub_path = epub_path
         self.chapters = {}  # chapter_name -> list of VocabEntry
@@ -121,16 +356,37 @@ class EPUBVocabParser:
                 key=lambda x: int(re.search(r"chapter-(\d+)", x).group(1)),
             )
 
+            # Big books: one chapter per worker process (parsing is CPU-bound)
+            workers = min(len(chapter_files), os.cpu_count() or 1)
+            total_size = sum(zf.getinfo(f).file_size for f in chapter_files)
+            if workers > 1 and total_size >= self.PARALLEL_MIN_BYTES:
+                items = [(f, zf.read(f)) for f in chapter_files]
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    # map keeps chapter order
+                    for chapters in pool.map(_parse_chapter_worker, items):
+                        self.chapters.update(chapters)
+                return self.chapters
+
             for chapter_file in chapter_files:
                 with zf.open(chapter_file) as f:
-                    content = f.read().decode("utf-8")
-                    self._parse_chapter(chapter_file, content)
+                    self._parse_chapter_file(chapter_file, f)
 
         return self.chapters
 
+    def _parse_chapter_file(self, filename: str, f):
+        """Parse a chapter from a binary file object with the best parser"""
+        # selectolax is faster still; without it, stream with lxml
+        if LexborHTMLParser is None and lxml_etree is not None:
+            self._parse_chapter_stream(filename, f)
+        else:
+            self._parse_chapter(filename, f.read().decode("utf-8"))
+
     def _parse_chapter(self, filename: str, content: str):
         """Parse a single chapter"""
-        soup = BeautifulSoup(content, "html.parser")
+        if LexborHTMLParser is not None:
+            return self._parse_chapter_lexbor(filename, content)
+
+        soup = BeautifulSoup(content, HTML_PARSER)
 
         # Get chapter title from h1
         h1 = soup.find("h1")
@@ -155,6 +411,84 @@ class EPUBVocabParser:
         if entries:
             self.chapters[chapter_name] = entries
 
+    def _parse_chapter_lexbor(self, filename: str, content: str):
+        """Parse a single chapter with selectolax (same logic as bs4 path)"""
+        tree = LexborHTMLParser(content)
+
+        # Get chapter title from h1
+        h1 = tree.css_first("h1")
+        chapter_name = h1.text().strip() if h1 else filename
+
+        entries = []
+        current_subcategory = ""
+
+        # h2 (subcategories) and vocabulary entries, in document order
+        for node in tree.css("h2, div.l_outer"):
+            if node.tag == "h2":
+                current_subcategory = node.text().strip()
+                continue
+            try:
+                texts = []
+                for selector in self._SPAN_SELECTORS:
+                    span = node.css_first(selector)
+                    texts.append(span.text().strip() if span else "")
+                entry = self._build_entry(
+                    *texts, chapter=chapter_name, subcategory=current_subcategory
+                )
+            except Exception as e:
+                logger.warning("Error parsing entry: %s", e)
+                entry = None
+            if entry:
+                entries.append(entry)
+
+        if entries:
+            self.chapters[chapter_name] = entries
+
+    def _parse_chapter_stream(self, filename: str, f):
+        """Parse a chapter straight from the zip stream with lxml iterparse.
+
+        Only the current entry div is kept in memory: each handled element is
+        cleared and its already-handled previous siblings are dropped.
+        """
+        chapter_name = None
+        rows = []  # (span texts, subcategory) - h1 is only known once seen
+        current_subcategory = ""
+
+        for _, elem in lxml_etree.iterparse(
+            f, events=("end",), html=True, tag=("h1", "h2", "div")
+        ):
+            if elem.tag == "h1":
+                if chapter_name is None:
+                    chapter_name = "".join(elem.itertext()).strip()
+            elif elem.tag == "h2":
+                current_subcategory = "".join(elem.itertext()).strip()
+            elif "l_outer" in (elem.get("class") or "").split():
+                texts = [xp(elem).strip() for xp in self._SPAN_XPATHS]
+                rows.append((texts, current_subcategory))
+            else:
+                continue  # inner divs go away with their l_outer
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+        if chapter_name is None:
+            chapter_name = filename
+
+        entries = []
+        for texts, subcategory in rows:
+            try:
+                entry = self._build_entry(
+                    *texts, chapter=chapter_name, subcategory=subcategory
+                )
+            except Exception as e:
+                logger.warning("Error parsing entry: %s", e)
+                entry = None
+            if entry:
+                entries.append(entry)
+
+        if entries:
+            self.chapters[chapter_name] = entries
+
     def _parse_vocab_entry(
         self, div, chapter: str, subcategory: str
     ) -> Optional[VocabEntry]:
@@ -163,193 +497,94 @@ class EPUBVocabParser:
             # Vietnamese meaning
             trans_span = div.find("span", class_="top_trans")
             meaning_vi_raw = trans_span.get_text().strip() if trans_span else ""
-            # Clean Vietnamese - remove any Japanese characters mixed in
-            meaning_vi = self._clean_vietnamese(meaning_vi_raw)
 
             # Japanese word (Kanji or Kana)
             word_span = div.find("span", class_="top_word")
             word_raw = word_span.get_text().strip() if word_span else ""
-            # Clean Japanese - only keep Japanese characters
-            word = self._clean_japanese(word_raw)
 
             # Romaji reading
             post_span = div.find("span", class_="top_post")
             romaji_raw = post_span.get_text().strip() if post_span else ""
-            # Remove parentheses and clean
-            romaji = romaji_raw.strip("()").lower()
-            romaji = "".join(c for c in romaji if c.isalpha() or c.isspace())
-
-            if not word or not meaning_vi:
-                return None
 
-            entry = VocabEntry(
-                word=word,
-                reading=self._romaji_to_hiragana(romaji),
-                romaji=romaji,
-                meaning_vi=meaning_vi,
-                chapter=chapter,
-                sub_category=subcategory,
+            return self._build_entry(
+                meaning_vi_raw, word_raw, romaji_raw, chapter, subcategory
             )
-            entry.generate_takoboto_link()
-
-            return entry
 
         except Exception as e:
-            print(f"Error parsing entry: {e}")
+            logger.warning("Error parsing entry: %s", e)
             return None
 
+    def _build_entry(
+        self,
+        meaning_vi_raw: str,
+        word_raw: str,
+        romaji_raw: str,
+        chapter: str,
+        subcategory: str,
+    ) -> Optional[VocabEntry]:
+        """Build an entry from the raw span texts of one vocabulary div"""
+        # Clean Vietnamese - remove any Japanese characters mixed in
+        meaning_vi = self._clean_vietnamese(meaning_vi_raw)
+        # Clean Japanese - only keep Japanese characters
+        word = self._clean_japanese(word_raw)
+
+        # Remove parentheses and clean
+        romaji = romaji_raw.strip("()").lower()
+        romaji = "".join(c for c in romaji if c.isalpha() or c.isspace())
+
+        if not word or not meaning_vi:
+            return None
+
+        return VocabEntry(
+            word=word,
+            reading=self._romaji_to_hiragana(romaji),
+            romaji=romaji,
+            meaning_vi=meaning_vi,
+            chapter=chapter,
+            sub_category=subcategory,
+        )
+
     def _clean_japanese(self, text: str) -> str:
         """Keep only Japanese characters (Hiragana, Katakana, Kanji)"""
-        result = []
-        for char in text:
-            code = ord(char)
-            # Hiragana: 3040-309F, Katakana: 30A0-30FF, Kanji: 4E00-9FFF, 々
-            if (
-                0x3040 <= code <= 0x309F  # Hiragana
-                or 0x30A0 <= code <= 0x30FF  # Katakana
-                or 0x4E00 <= code <= 0x9FFF  # Common Kanji
-                or char == "々"
-            ):  # Kanji repeat mark
-                result.append(char)
-        return "".join(result)
+        return self._NON_JAPANESE_RE.sub("", text)
 
     def _clean_vietnamese(self, text: str) -> str:
         """Keep only Vietnamese/Latin characters, remove Japanese"""
-        result = []
-        for char in text:
-            code = ord(char)
-            # Skip Japanese characters
-            if (
-                0x3040 <= code <= 0x309F  # Hiragana
-                or 0x30A0 <= code <= 0x30FF  # Katakana
-                or 0x4E00 <= code <= 0x9FFF
-            ):  # Kanji
-                continue
-            result.append(char)
-        return "".join(result).strip()
+        return self._JAPANESE_RE.sub("", text).strip()
 
-    def _romaji_to_hiragana(self, romaji: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _romaji_to_hiragana(romaji: str) -> str:
         """Convert romaji to hiragana (basic conversion)"""
         # This is a simplified conversion - for production, use a proper library
-        romaji_map = {
-            "a": "あ",
-            "i": "い",
-            "u": "う",
-            "e": "え",
-            "o": "お",
-            "ka": "か",
-            "ki": "き",
-            "ku": "く",
-            "ke": "け",
-            "ko": "こ",
-            "sa": "さ",
-            "shi": "し",
-            "su": "す",
-            "se": "せ",
-            "so": "そ",
-            "ta": "た",
-            "chi": "ち",
-            "tsu": "つ",
-            "te": "て",
-            "to": "と",
-            "na": "な",
-            "ni": "に",
-            "nu": "ぬ",
-            "ne": "ね",
-            "no": "の",
-            "ha": "は",
-            "hi": "ひ",
-            "fu": "ふ",
-            "he": "へ",
-            "ho": "ほ",
-            "ma": "ま",
-            "mi": "み",
-            "mu": "む",
-            "me": "め",
-            "mo": "も",
-            "ya": "や",
-            "yu": "ゆ",
-            "yo": "よ",
-            "ra": "ら",
-            "ri": "り",
-            "ru": "る",
-            "re": "れ",
-            "ro": "ろ",
-            "wa": "わ",
-            "wo": "を",
-            "n": "ん",
-            "ga": "が",
-            "gi": "ぎ",
-            "gu": "ぐ",
-            "ge": "げ",
-            "go": "ご",
-            "za": "ざ",
-            "ji": "じ",
-            "zu": "ず",
-            "ze": "ぜ",
-            "zo": "ぞ",
-            "da": "だ",
-            "di": "ぢ",
-            "du": "づ",
-            "de": "で",
-            "do": "ど",
-            "ba": "ば",
-            "bi": "び",
-            "bu": "ぶ",
-            "be": "べ",
-            "bo": "ぼ",
-            "pa": "ぱ",
-            "pi": "ぴ",
-            "pu": "ぷ",
-            "pe": "ぺ",
-            "po": "ぽ",
-            "kya": "きゃ",
-            "kyu": "きゅ",
-            "kyo": "きょ",
-            "sha": "しゃ",
-            "shu": "しゅ",
-            "sho": "しょ",
-            "cha": "ちゃ",
-            "chu": "ちゅ",
-            "cho": "ちょ",
-            "nya": "にゃ",
-            "nyu": "にゅ",
-            "nyo": "にょ",
-            "hya": "ひゃ",
-            "hyu": "ひゅ",
-            "hyo": "ひょ",
-            "mya": "みゃ",
-            "myu": "みゅ",
-            "myo": "みょ",
-            "rya": "りゃ",
-            "ryu": "りゅ",
-            "ryo": "りょ",
-            "gya": "ぎゃ",
-            "gyu": "ぎゅ",
-            "gyo": "ぎょ",
-            "ja": "じゃ",
-            "ju": "じゅ",
-            "jo": "じょ",
-            "bya": "びゃ",
-            "byu": "びゅ",
-            "byo": "びょ",
-            "pya": "ぴゃ",
-            "pyu": "ぴゅ",
-            "pyo": "ぴょ",
-            # Long vowels
-            "ā": "ああ",
-            "ī": "いい",
-            "ū": "うう",
-            "ē": "ええ",
-            "ō": "おお",
-        }
+        text = romaji.lower()
+        trie = EPUBVocabParser._ROMAJI_TRIE
+        result = []
+        i, n = 0, len(text)
+        while i < n:
+            # Descend as far as the trie allows, remembering the last output
+            node, j = trie, i
+            match, match_end = None, i
+            while j < n and text[j] in node:
+                node = node[text[j]]
+                j += 1
+                if "" in node:
+                    match, match_end = node[""], j
+            if match is None:
+                result.append(text[i])  # no key starts here, keep as-is
+                i += 1
+            else:
+                result.append(match)
+                i = match_end
+        return "".join(result)
 
-        result = romaji.lower()
-        # Sort by length (longest first) to avoid partial replacements
-        for r, h in sorted(romaji_map.items(), key=lambda x: -len(x[0])):
-            result = result.replace(r, h)
 
-        return result
+def _parse_chapter_worker(item: Tuple[str, bytes]) -> Dict[str, List[VocabEntry]]:
+    """Process-pool entry point: parse one (filename, bytes) chapter"""
+    filename, data = item
+    parser = EPUBVocabParser("")
+    parser._parse_chapter_file(filename, io.BytesIO(data))
+    return parser.chapters
 
 
 # =============================================================================
@@ -357,6 +592,231 @@ class EPUBVocabParser:
 # =============================================================================
 
 
+class TokenBucket:
+    """Thread-safe token bucket (reservation style: callers sleep off their debt)"""
+
+    MIN_RATE_FACTOR = 1 / 16  # backoff never drops below 1/16 of configured rate
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Take one token, sleeping until it is available"""
+        if self.rate <= 0:
+            return  # Unlimited
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+            # Exponential recovery after a 429 backoff
+            self.rate = min(self.max_rate, self.rate * 1.25)
+        if wait:
+            time.sleep(wait)
+
+    def backoff(self, retry_after: float):
+        """Server said slow down: halve the rate and block for retry_after"""
+        if self.max_rate <= 0:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.max_rate * self.MIN_RATE_FACTOR, self.rate / 2)
+            self.tokens = min(self.tokens, -retry_after * self.rate)
+
+
+class RateLimiter:
+    """One token bucket per API host, shared by all enrichment threads"""
+
+    _buckets: Dict[str, TokenBucket] = {}
+    _lock = threading.Lock()
+    _rate: float = 2.0  # requests per second per host
+    _session: Optional[requests.Session] = None
+    MAX_RETRIES = 3
+    POOL_MAXSIZE = 32  # keep-alive connections per host (>= enrichment workers)
+
+    @classmethod
+    def configure(cls, delay: float):
+        """Set the per-host rate from the CLI delay (seconds between requests)"""
+        with cls._lock:
+            cls._rate = 1.0 / delay if delay > 0 else 0.0
+            cls._buckets = {}
+
+    @classmethod
+    def bucket(cls, host: str) -> TokenBucket:
+        with cls._lock:
+            if host not in cls._buckets:
+                cls._buckets[host] = TokenBucket(cls._rate)
+            return cls._buckets[host]
+
+    @classmethod
+    def acquire(cls, host: str):
+        cls.bucket(host).acquire()
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        """Shared keep-alive session: one TLS handshake per pooled connection"""
+        with cls._lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=8, pool_maxsize=cls.POOL_MAXSIZE
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def get(cls, url: str, **kwargs) -> requests.Response:
+        """GET on the shared session, throttled per host, honoring 429 Retry-After"""
+        bucket = cls.bucket(urllib.parse.urlsplit(url).hostname or "")
+        session = cls.session()
+        for attempt in range(cls.MAX_RETRIES):
+            bucket.acquire()
+            response = session.get(url, **kwargs)
+            if response.status_code != 429:
+                return response
+            try:
+                retry_after = float(response.headers.get("Retry-After", ""))
+            except ValueError:
+                retry_after = 2.0**attempt
+            bucket.backoff(retry_after)
+        return response
+
+
+class CacheDB:
+    """One SQLite key-value store (data/cache.sqlite) for per-word API results
+
+    Replaces one tiny file per word: a lookup is a primary-key SELECT instead
+    of stat + open + read. The old per-word files are still read on a miss
+    and copied in, so existing caches keep working.
+    """
+
+    _path = Path(__file__).parent / "data" / "cache.sqlite"
+    _conn: Optional[sqlite3.Connection] = None
+    _lock = threading.Lock()  # one connection shared by the worker threads
+    # Writes are buffered and committed FLUSH_EVERY at a time, one transaction
+    # each, instead of one commit per word
+    _pending: Dict[Tuple[str, str], bytes] = {}
+    FLUSH_EVERY = 200
+
+    @classmethod
+    def _connect(cls) -> sqlite3.Connection:
+        if cls._conn is None:
+            conn = sqlite3.connect(
+                str(cls._path), isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS kv ("
+                "ns TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                "PRIMARY KEY (ns, key))"
+            )
+            cls._conn = conn
+            atexit.register(cls.close)
+        return cls._conn
+
+    @classmethod
+    def get(cls, ns: str, key: str, legacy_file: Path = None) -> Optional[bytes]:
+        """Cached value, falling back to (and importing) a legacy cache file"""
+        try:
+            with cls._lock:
+                pending = cls._pending.get((ns, key))
+                if pending is not None:
+                    return pending
+                row = (
+                    cls._connect()
+                    .execute("SELECT value FROM kv WHERE ns=? AND key=?", (ns, key))
+                    .fetchone()
+                )
+        except sqlite3.Error as e:
+            logger.debug("Cache read error (%s, %s): %s", ns, key, e)
+            row = None
+        if row is not None:
+            return row[0]
+
+        if legacy_file is not None and legacy_file.exists():
+            try:
+                value = legacy_file.read_bytes()
+            except OSError:
+                return None
+            cls.put(ns, key, value)
+            return value
+        return None
+
+    @classmethod
+    def get_many(cls, ns: str, keys: Iterable[str]) -> Dict[str, bytes]:
+        """Values of every cached key in one query per 500 keys"""
+        keys = list(keys)
+        found = {}
+        try:
+            with cls._lock:
+                cls._flush_locked()
+                conn = cls._connect()
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start : start + 500]
+                    found.update(
+                        conn.execute(
+                            "SELECT key, value FROM kv WHERE ns=? AND key IN "
+                            f"({','.join('?' * len(chunk))})",
+                            (ns, *chunk),
+                        ).fetchall()
+                    )
+        except sqlite3.Error as e:
+            logger.debug("Cache read error (%s): %s", ns, e)
+        return found
+
+    @classmethod
+    def put(cls, ns: str, key: str, value: bytes):
+        with cls._lock:
+            cls._pending[(ns, key)] = value
+            if len(cls._pending) >= cls.FLUSH_EVERY:
+                cls._flush_locked()
+
+    @classmethod
+    def flush(cls):
+        with cls._lock:
+            cls._flush_locked()
+
+    @classmethod
+    def _flush_locked(cls):
+        """Write buffered puts in one transaction (caller holds _lock)"""
+        if not cls._pending:
+            return
+        rows = [(ns, key, value) for (ns, key), value in cls._pending.items()]
+        cls._pending.clear()
+        try:
+            conn = cls._connect()
+            with conn:  # BEGIN ... COMMIT (ROLLBACK on error)
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO kv (ns, key, value) VALUES (?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.debug("Cache write error (%d rows): %s", len(rows), e)
+
+    @classmethod
+    def close(cls):
+        with cls._lock:
+            cls._flush_locked()
+            if cls._conn is not None:
+                try:
+                    cls._conn.close()
+                except sqlite3.Error:
+                    pass
+                cls._conn = None
+
+
 class JishoAPI:
     """Jisho.org API for English meanings and additional data"""
 
@@ -365,7 +825,20 @@ class JishoAPI:
     # Cache for full Jisho responses
     _jisho_cache_dir: Path = None
     _english_cache_dir: Path = None
-    last_api_called: bool = False
+    # In-process memo in front of the disk caches: each entry reads the same
+    # payload 4+ times (reading, word type, synonyms, english)
+    _memory_cache: Dict[str, Dict] = {}
+    _english_memory: Dict[str, str] = {}
+    _fields_memory: Dict[str, Dict[str, str]] = {}  # word -> _senses_from()
+    # Striped locks: enrichment workers asking for the same word wait for the
+    # first one's request instead of sending their own
+    _lookup_locks = [threading.Lock() for _ in range(64)]
+    _api_called = _ThreadFlag()  # see was_api_called()
+
+    @classmethod
+    def was_api_called(cls) -> bool:
+        """Whether this thread's last lookup went to the API (not the cache)"""
+        return cls._api_called.value
 
     @classmethod
     def _init_cache(cls):
@@ -394,90 +867,151 @@ class JishoAPI:
 
     @classmethod
     def lookup(cls, word: str, use_cache: bool = True) -> Dict:
-        """Look up a word in Jisho with caching"""
-        cls._init_cache()
+        """Look up a word in Jisho with caching (memory, then disk, then API)"""
+        if use_cache and word in cls._memory_cache:
+            return cls._memory_cache[word]
+        with cls._lookup_locks[hash(word) % len(cls._lookup_locks)]:
+            if use_cache and word in cls._memory_cache:
+                return cls._memory_cache[word]
+            result = cls._lookup_disk_or_api(word, use_cache)
+            cls._memory_cache[word] = result
+        return result
 
-        word_hash = hashlib.md5(word.encode()).hexdigest()[:12]
-        cache_file = cls._jisho_cache_dir / f"{word_hash}.json"
+    @classmethod
+    def _lookup_disk_or_api(cls, word: str, use_cache: bool) -> Dict:
+        """Look up a word from the disk cache or the Jisho API"""
+        cls._init_cache()
 
-        # Check cache
-        if use_cache and cache_file.exists():
-            try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except:
-                pass
+        # Check cache (SQLite, then the old per-word file)
+        if use_cache:
+            word_hash = _cache_name(word)
+            cached = CacheDB.get(
+                "jisho", word, cls._jisho_cache_dir / f"{word_hash}.json"
+            )
+            if cached is not None:
+                try:
+                    return _json_loads(cached)
+                except:
+                    pass
 
         # Fetch from API
-        cls.last_api_called = True
+        cls._api_called.value = True
         try:
             url = f"{cls.BASE_URL}?keyword={urllib.parse.quote(word)}"
-            response = requests.get(url, timeout=10)
+            response = RateLimiter.get(url, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 if data.get("data"):
                     # Find exact match first
                     for result in data["data"]:
                         if cls._is_exact_match(result, word):
                             # Cache result
-                            try:
-                                with open(cache_file, "w", encoding="utf-8") as f:
-                                    json.dump(result, f, ensure_ascii=False)
-                            except:
-                                pass
+                            CacheDB.put("jisho", word, _json_dumpb(result))
                             return result
 
                     # No exact match found - cache empty result
                     # Don't return partial match as it causes wrong meanings!
-                    try:
-                        with open(cache_file, "w", encoding="utf-8") as f:
-                            json.dump({}, f)
-                    except:
-                        pass
+                    CacheDB.put("jisho", word, b"{}")
                     return {}
         except Exception as e:
-            print(f"Jisho lookup error for {word}: {e}")
+            logger.warning("Jisho lookup error for %s: %s", word, e)
 
         # Cache empty result
-        try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump({}, f)
-        except:
-            pass
+        CacheDB.put("jisho", word, b"{}")
         return {}
 
+    @classmethod
+    def preload(cls, words: Iterable[str]):
+        """Fill the memory cache from the SQLite cache in bulk queries"""
+        missing = [w for w in dict.fromkeys(words) if w not in cls._memory_cache]
+        for word, raw in CacheDB.get_many("jisho", missing).items():
+            try:
+                cls._memory_cache[word] = _json_loads(raw)
+            except:
+                pass
+
     @classmethod
     def get_english_meaning(cls, word: str) -> str:
         """Get English meaning from Jisho with cache"""
+        cls._api_called.value = False
+        if word in cls._english_memory:
+            return cls._english_memory[word]
+        meaning = cls._get_english_meaning_uncached(word)
+        cls._english_memory[word] = meaning
+        return meaning
+
+    @classmethod
+    def _get_english_meaning_uncached(cls, word: str) -> str:
         cls._init_cache()
-        cls.last_api_called = False
 
         # Check old-style cache first (for backwards compatibility)
-        word_hash = hashlib.md5(word.encode()).hexdigest()[:12]
-        cache_file = cls._english_cache_dir / f"{word_hash}.txt"
-        if cache_file.exists():
-            cached = cache_file.read_text(encoding="utf-8")
+        word_hash = _cache_name(word)
+        cached = CacheDB.get(
+            "english", word, cls._english_cache_dir / f"{word_hash}.txt"
+        )
+        if cached is not None:
+            cached = cached.decode("utf-8")
             return "" if cached == "_EMPTY_" else cached
 
         # Get from full Jisho data
-        data = cls.lookup(word)
-        meaning = ""
-        if data and "senses" in data:
-            meanings = []
-            for sense in data["senses"][:2]:  # First 2 senses
-                if "english_definitions" in sense:
-                    meanings.extend(sense["english_definitions"][:3])
-            meaning = "; ".join(meanings)
+        meaning = cls._fields(word)["english"]
 
         # Save to cache (including empty to avoid re-fetching)
-        cache_file.write_text(meaning if meaning else "_EMPTY_", encoding="utf-8")
+        CacheDB.put("english", word, (meaning or "_EMPTY_").encode("utf-8"))
 
         return meaning
 
+    @classmethod
+    def get_all(cls, word: str) -> Dict[str, str]:
+        """Reading, word type, synonyms, antonyms and English from one payload"""
+        return dict(cls._fields(word), reading=cls.get_reading(word))
+
+    @classmethod
+    def _fields(cls, word: str) -> Dict[str, str]:
+        """Memoized _senses_from: get_all and get_english_meaning share it"""
+        fields = cls._fields_memory.get(word)
+        if fields is None:
+            fields = cls._senses_from(cls.lookup(word))
+            cls._fields_memory[word] = fields
+        return fields
+
+    @staticmethod
+    def _senses_from(data: Dict) -> Dict[str, str]:
+        """Word type, synonyms, antonyms and English in one walk over the senses"""
+        if not data or "senses" not in data:
+            return {"word_type": "", "synonyms": "", "antonyms": "", "english": ""}
+
+        pos_set = set()
+        meanings = []
+        synonyms = []
+        antonyms = []
+        for i, sense in enumerate(data["senses"]):
+            if i < 2:  # First 2 senses: part of speech + English
+                pos_set.update(sense.get("parts_of_speech", []))
+                if "english_definitions" in sense:
+                    meanings.extend(sense["english_definitions"][:3])
+            # See also = similar words; antonyms are less common in Jisho
+            synonyms.extend(sense.get("see_also", [])[:3])
+            antonyms.extend(sense.get("antonyms", [])[:3])
+
+        # Add furigana to each related word
+        syn_with_ruby = SentenceFuriganaGenerator.generate_batch(synonyms[:4])
+        ant_with_ruby = SentenceFuriganaGenerator.generate_batch(antonyms[:4])
+
+        return {
+            "word_type": JishoAPI._format_word_type(pos_set),
+            "synonyms": " • ".join(syn_with_ruby),
+            "antonyms": " • ".join(ant_with_ruby),
+            "english": "; ".join(meanings),
+        }
+
     @classmethod
     def get_reading(cls, word: str) -> str:
         """Get correct reading (furigana) from Jisho"""
-        data = cls.lookup(word)
+        return cls._reading_from(cls.lookup(word), word)
+
+    @staticmethod
+    def _reading_from(data: Dict, word: str) -> str:
         if not data:
             return ""
 
@@ -494,16 +1028,11 @@ class JishoAPI:
     @classmethod
     def get_word_type(cls, word: str) -> str:
         """Get part of speech from Jisho. Returns formatted string."""
-        data = cls.lookup(word)
-        if not data or "senses" not in data:
-            return ""
-
-        # Collect unique parts of speech
-        pos_set = set()
-        for sense in data.get("senses", [])[:2]:
-            for pos in sense.get("parts_of_speech", []):
-                pos_set.add(pos)
+        return cls._fields(word)["word_type"]
 
+    @staticmethod
+    def _format_word_type(pos_set: set) -> str:
+        """Unique parts of speech -> Vietnamese labels"""
         if not pos_set:
             return ""
 
@@ -542,27 +1071,8 @@ class JishoAPI:
     @classmethod
     def get_synonyms_antonyms(cls, word: str) -> Tuple[str, str]:
         """Get synonyms and antonyms from Jisho with furigana. Returns (synonyms, antonyms)."""
-        data = cls.lookup(word)
-        if not data or "senses" not in data:
-            return "", ""
-
-        synonyms = []
-        antonyms = []
-
-        for sense in data.get("senses", []):
-            # See also = similar words
-            see_also = sense.get("see_also", [])
-            synonyms.extend(see_also[:3])
-
-            # Antonyms (less common in Jisho)
-            ant = sense.get("antonyms", [])
-            antonyms.extend(ant[:3])
-
-        # Add furigana to each word
-        syn_with_ruby = [SentenceFuriganaGenerator.generate(s) for s in synonyms[:4]]
-        ant_with_ruby = [SentenceFuriganaGenerator.generate(a) for a in antonyms[:4]]
-
-        return " • ".join(syn_with_ruby), " • ".join(ant_with_ruby)
+        fields = cls._fields(word)
+        return fields["synonyms"], fields["antonyms"]
 
 
 class KanjiAPI:
@@ -570,7 +1080,13 @@ class KanjiAPI:
 
     BASE_URL = "https://kanjiapi.dev/v1/kanji"
     _cache_dir: Path = None
-    last_api_called: bool = False
+    _memory_cache: Dict[str, Dict] = {}  # kanji repeat across many entries
+    _api_called = _ThreadFlag()  # see was_api_called()
+
+    @classmethod
+    def was_api_called(cls) -> bool:
+        """Whether this thread's last lookup went to the API (not the cache)"""
+        return cls._api_called.value
 
     @classmethod
     def _init_cache(cls):
@@ -582,34 +1098,40 @@ class KanjiAPI:
     def lookup(cls, kanji: str, use_cache: bool = True) -> Dict:
         """Look up a single kanji character"""
         cls._init_cache()
-        cls.last_api_called = False
+        cls._api_called.value = False
 
         if len(kanji) != 1:
             return {}
 
+        if use_cache and kanji in cls._memory_cache:
+            return cls._memory_cache[kanji]
+
         cache_file = cls._cache_dir / f"{ord(kanji)}.json"
 
         if use_cache and cache_file.exists():
             try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                with open(cache_file, "rb") as f:
+                    data = _json_loads(f.read())
+                cls._memory_cache[kanji] = data
+                return data
             except:
                 pass
 
-        cls.last_api_called = True
+        cls._api_called.value = True
         try:
             url = f"{cls.BASE_URL}/{urllib.parse.quote(kanji)}"
-            response = requests.get(url, timeout=10)
+            response = RateLimiter.get(url, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 try:
                     with open(cache_file, "w", encoding="utf-8") as f:
-                        json.dump(data, f, ensure_ascii=False)
+                        _json_dump(data, f)
                 except:
                     pass
+                cls._memory_cache[kanji] = data
                 return data
         except Exception as e:
-            print(f"KanjiAPI error for {kanji}: {e}")
+            logger.warning("KanjiAPI error for %s: %s", kanji, e)
 
         return {}
 
@@ -628,7 +1150,15 @@ class PitchAccentAPI:
     PITCH_DB: Dict[str, Tuple[str, List[str]]] = {}
     _loaded = False
     _cache_dir: Path = None
-    last_api_called: bool = False
+    _pattern_memory: Dict[str, str] = {}  # word -> pattern from cache/API
+    _api_called = _ThreadFlag()  # see was_api_called()
+    # One mora = any char + an optional small kana that combines with it
+    _MORA_RE = re.compile(r".[ゃゅょャュョァィゥェォ]?", re.S)
+
+    @classmethod
+    def was_api_called(cls) -> bool:
+        """Whether this thread's last lookup went to the API (not the cache)"""
+        return cls._api_called.value
 
     @classmethod
     def _load(cls):
@@ -641,15 +1171,22 @@ class PitchAccentAPI:
 
         json_path = Path(__file__).parent / "data" / "pitch_accent.json"
         if json_path.exists():
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(json_path, "rb") as f:
+                data = _json_loads(f.read())
                 data.pop("_comment", None)
                 # Convert: {"word": [["reading", pattern], ...]} -> {"word": (str(pattern), [morae])}
+                # Interned strings: the few distinct patterns / kana are shared
+                # by every entry, and words with the same reading share one list
+                intern = sys.intern
+                morae_by_reading: Dict[str, List[str]] = {}
                 for word, readings in data.items():
                     if readings:
                         reading, pattern = readings[0]  # Take first reading
-                        morae = cls.split_morae(reading)
-                        cls.PITCH_DB[word] = (str(pattern), morae)
+                        morae = morae_by_reading.get(reading)
+                        if morae is None:
+                            morae = [intern(m) for m in cls.split_morae(reading)]
+                            morae_by_reading[reading] = morae
+                        cls.PITCH_DB[intern(word)] = (intern(str(pattern)), morae)
         cls._loaded = True
 
     @classmethod
@@ -658,22 +1195,26 @@ class PitchAccentAPI:
     ) -> Tuple[str, List[str]]:
         """Get pitch pattern for a word"""
         cls._load()
-        cls.last_api_called = False
+        cls._api_called.value = False
 
         # 1. Check local DB
-        if word in cls.PITCH_DB:
-            return cls.PITCH_DB[word]
+        hit = cls.PITCH_DB.get(word)
+        if hit is not None:
+            return hit
 
         morae = cls.split_morae(reading)
 
-        # 2. Check cache - use stable hash
-        word_hash = hashlib.md5(word.encode()).hexdigest()[:12]
-        cache_file = cls._cache_dir / f"{word_hash}.json"
-        if cache_file.exists():
+        if word in cls._pattern_memory:
+            return (cls._pattern_memory[word], morae)
+
+        # 2. Check cache (SQLite, then the old per-word file)
+        word_hash = _cache_name(word)
+        cached = CacheDB.get("pitch", word, cls._cache_dir / f"{word_hash}.json")
+        if cached is not None:
             try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    cached = json.load(f)
-                    return (str(cached.get("pattern", "?")), morae)
+                pattern = str(_json_loads(cached).get("pattern", "?"))
+                cls._pattern_memory[word] = pattern
+                return (pattern, morae)
             except:
                 pass
 
@@ -682,15 +1223,16 @@ class PitchAccentAPI:
             return ("?", morae)
 
         # 4. Fetch from Jisho API
-        cls.last_api_called = True
+        cls._api_called.value = True
         pattern = cls._fetch_from_jisho(word, reading)
+        cls._pattern_memory[word] = pattern
 
         # 5. Save to cache (including '?' to avoid re-fetching)
-        try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump({"word": word, "reading": reading, "pattern": pattern}, f)
-        except:
-            pass
+        CacheDB.put(
+            "pitch",
+            word,
+            _json_dumpb({"word": word, "reading": reading, "pattern": pattern}),
+        )
 
         return (pattern, morae)
 
@@ -699,9 +1241,9 @@ class PitchAccentAPI:
         """Fetch pitch from Jisho API (has partial pitch data)"""
         try:
             url = f"https://jisho.org/api/v1/search/words?keyword={urllib.parse.quote(word)}"
-            response = requests.get(url, timeout=5)
+            response = RateLimiter.get(url, timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 for item in data.get("data", []):
                     japanese = item.get("japanese", [])
                     for jp in japanese:
@@ -721,24 +1263,22 @@ class PitchAccentAPI:
     @staticmethod
     def split_morae(text: str) -> List[str]:
         """Split Japanese text into morae"""
-        # Small kana that combine with previous
-        small_kana = "ゃゅょャュョァィゥェォ"
-
-        morae = []
-        i = 0
-        while i < len(text):
-            if i + 1 < len(text) and text[i + 1] in small_kana:
-                morae.append(text[i : i + 2])
-                i += 2
-            else:
-                morae.append(text[i])
-                i += 1
-        return morae
+        return PitchAccentAPI._MORA_RE.findall(text)
 
 
 class PitchDiagramGenerator:
     """Generate SVG pitch accent diagrams"""
 
+    _SVG_STYLE = "\n".join(
+        [
+            "<style>",
+            '  .mora-text { font-family: "Noto Sans JP", sans-serif; font-size: 16px; text-anchor: middle; }',
+            "  .pitch-line { stroke: #e74c3c; stroke-width: 2; fill: none; }",
+            "  .pitch-dot { fill: #e74c3c; }",
+            "</style>",
+        ]
+    )
+
     @staticmethod
     def generate_svg(reading: str, pattern: str, morae: List[str]) -> str:
         """
@@ -754,11 +1294,28 @@ class PitchDiagramGenerator:
         """
         if not morae:
             morae = PitchAccentAPI.split_morae(reading)
+        # Same (pattern, morae) -> same SVG; many words share a reading shape
+        return PitchDiagramGenerator._render_svg(pattern, tuple(morae))
 
-        num_morae = len(morae)
-        if num_morae == 0:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _render_svg(pattern: str, morae: Tuple[str, ...]) -> str:
+        """Build the SVG for a pattern over the given morae (memoized)"""
+        if not morae:
             return ""
+        try:
+            pattern_num = int(pattern) if pattern.isdigit() else -1
+        except:
+            pattern_num = -1
+        # Only the mora glyphs differ between words of the same shape
+        return PitchDiagramGenerator._svg_template(pattern_num, len(morae)).format(
+            *morae
+        )
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _svg_template(pattern_num: int, num_morae: int) -> str:
+        """SVG for one (pattern, mora count) with {0}..{n-1} for the morae"""
         # SVG dimensions
         mora_width = 30
         width = mora_width * num_morae + 40
@@ -770,12 +1327,6 @@ class PitchDiagramGenerator:
         text_y = 70
 
         # Determine pitch heights for each mora
-        heights = []
-        try:
-            pattern_num = int(pattern) if pattern.isdigit() else -1
-        except:
-            pattern_num = -1
-
         if pattern_num == 0:
             # 平板型 (heiban): low-high-high-high...
             heights = [low_y] + [high_y] * (num_morae - 1)
@@ -784,48 +1335,35 @@ class PitchDiagramGenerator:
             heights = [high_y] + [low_y] * (num_morae - 1)
         elif pattern_num > 1:
             # 中高型 (nakadaka) or 尾高型 (odaka)
-            heights = [low_y]  # First mora is low
-            for i in range(1, num_morae):
-                if i < pattern_num:
-                    heights.append(high_y)
-                else:
-                    heights.append(low_y)
+            # First mora is low, high until the accent, low after it
+            heights = [low_y] + [
+                high_y if i < pattern_num else low_y for i in range(1, num_morae)
+            ]
         else:
             # Unknown pattern - show flat
             heights = [high_y] * num_morae
 
-        # Build SVG
-        svg_parts = [
-            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
-            "<style>",
-            '  .mora-text { font-family: "Noto Sans JP", sans-serif; font-size: 16px; text-anchor: middle; }',
-            "  .pitch-line { stroke: #e74c3c; stroke-width: 2; fill: none; }",
-            "  .pitch-dot { fill: #e74c3c; }",
-            "</style>",
-        ]
+        # x of each mora column
+        xs = [20 + i * mora_width + mora_width // 2 for i in range(num_morae)]
 
-        # Draw pitch line
-        points = []
-        for i, (mora, h) in enumerate(zip(morae, heights)):
-            x = 20 + i * mora_width + mora_width // 2
-            points.append(f"{x},{h}")
-
-        if len(points) > 1:
-            svg_parts.append(
-                f'<polyline class="pitch-line" points="{" ".join(points)}" />'
-            )
+        # Pitch line (only when there is something to connect)
+        line = ""
+        if num_morae > 1:
+            points = " ".join(f"{x},{h}" for x, h in zip(xs, heights))
+            line = f'<polyline class="pitch-line" points="{points}" />\n'
 
-        # Draw dots and text
-        for i, (mora, h) in enumerate(zip(morae, heights)):
-            x = 20 + i * mora_width + mora_width // 2
-            svg_parts.append(f'<circle class="pitch-dot" cx="{x}" cy="{h}" r="4" />')
-            svg_parts.append(
-                f'<text class="mora-text" x="{x}" y="{text_y}">{mora}</text>'
-            )
-
-        svg_parts.append("</svg>")
+        # Dots and text placeholders
+        dots = "\n".join(
+            f'<circle class="pitch-dot" cx="{x}" cy="{h}" r="4" />\n'
+            f'<text class="mora-text" x="{x}" y="{text_y}">{{{i}}}</text>'
+            for i, (x, h) in enumerate(zip(xs, heights))
+        )
 
-        return "\n".join(svg_parts)
+        style = PitchDiagramGenerator._SVG_STYLE.replace("{", "{{").replace("}", "}}")
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">\n'
+            f"{style}\n{line}{dots}\n</svg>"
+        )
 
 
 class StrokeOrderAPI:
@@ -834,52 +1372,118 @@ class StrokeOrderAPI:
     KANJIVG_URL = (
         "https://raw.githubusercontent.com/KanjiVG/kanjivg/master/kanji/{}.svg"
     )
+    # Processed SVGs shared by every output dir (like the other API caches)
+    _cache_dir: Path = None
+    # kanji -> final SVG ("" = KanjiVG has none); transient errors stay out
+    _memory_cache: Dict[str, str] = {}
 
     @staticmethod
     def get_stroke_order_svg(kanji: str) -> str:
-        """Get stroke order SVG for a single kanji"""
+        """Get stroke order SVG for a single kanji (memory, disk, then KanjiVG)"""
+        svg = StrokeOrderAPI.get_cached_svg(kanji)
+        if svg is not None:
+            return svg
+        return StrokeOrderAPI._fetch_svg(kanji)
+
+    @staticmethod
+    def _cache_file(kanji: str) -> Path:
+        if StrokeOrderAPI._cache_dir is None:
+            StrokeOrderAPI._cache_dir = Path(__file__).parent / "data" / "kanjivg_cache"
+            StrokeOrderAPI._cache_dir.mkdir(exist_ok=True)
+        # Get unicode code point
+        return StrokeOrderAPI._cache_dir / f"{format(ord(kanji), '05x')}.svg"
+
+    @staticmethod
+    def get_cached_svg(kanji: str) -> Optional[str]:
+        """SVG from memory or the disk cache; None if never fetched successfully"""
         if len(kanji) != 1:
             return ""
 
-        # Get unicode code point
-        code = format(ord(kanji), "05x")
-        url = StrokeOrderAPI.KANJIVG_URL.format(code)
+        svg = StrokeOrderAPI._memory_cache.get(kanji)
+        if svg is not None:
+            return svg
+
+        cache_file = StrokeOrderAPI._cache_file(kanji)
+        if cache_file.exists():
+            try:
+                # Empty file = KanjiVG has no diagram for this character
+                svg = cache_file.read_bytes().decode("utf-8")
+                StrokeOrderAPI._memory_cache[kanji] = svg
+                return svg
+            except:
+                pass
+        return None
+
+    @staticmethod
+    def _fetch_svg(kanji: str) -> str:
+        """Fetch from KanjiVG; only 200/404 answers are cached"""
+        cache_file = StrokeOrderAPI._cache_file(kanji)
+        url = StrokeOrderAPI.KANJIVG_URL.format(cache_file.stem)
 
         try:
-            response = requests.get(url, timeout=10)
+            response = RateLimiter.get(url, timeout=10)
             if response.status_code == 200:
-                return StrokeOrderAPI._add_stroke_numbers(response.text)
+                svg = StrokeOrderAPI._add_stroke_numbers(response.text)
+            elif response.status_code == 404:
+                svg = ""
+            else:
+                return ""  # transient - don't cache
+            StrokeOrderAPI._memory_cache[kanji] = svg
+            try:
+                cache_file.write_bytes(svg.encode("utf-8"))
+            except:
+                pass
+            return svg
         except Exception as e:
-            print(f"Stroke order fetch error for {kanji}: {e}")
+            logger.warning("Stroke order fetch error for %s: %s", kanji, e)
 
         return ""
 
+    @staticmethod
+    def prefetch(kanji_chars: Iterable[str], max_workers: int = 8):
+        """Warm the caches for many kanji concurrently (pooled session)"""
+        pending = list(dict.fromkeys(kanji_chars))
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in executor.map(StrokeOrderAPI.get_stroke_order_svg, pending):
+                pass
+
+    # Compiled once; _add_stroke_numbers runs for every fetched kanji
+    _XML_DECL_RE = re.compile(r"<\?xml[^>]*\?>")
+    _COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+    _KVG_NS_RE = re.compile(r'xmlns:kvg="[^"]*"')
+    _KVG_ATTR_RE = re.compile(r'kvg:[a-z]+="[^"]*"')
+    _FILL_RE = re.compile(r'\s+fill="[^"]*"')
+    _STROKE_RE = re.compile(r'\s+stroke="[^"]*"')
+    _SVG_RE = re.compile(r"(<svg[^>]*>.*</svg>)", re.DOTALL)
+    _SVG_OPEN_RE = re.compile(r"<svg([^>]*)>")
+
     @staticmethod
     def _add_stroke_numbers(svg_content: str) -> str:
         """Clean and simplify SVG for Anki display with dark mode support"""
-        import re
+        cls = StrokeOrderAPI
 
         # Remove XML declaration and comments
-        svg_content = re.sub(r"<\?xml[^>]*\?>", "", svg_content)
-        svg_content = re.sub(r"<!--.*?-->", "", svg_content, flags=re.DOTALL)
+        svg_content = cls._XML_DECL_RE.sub("", svg_content)
+        svg_content = cls._COMMENT_RE.sub("", svg_content)
 
         # Remove problematic attributes and elements
-        svg_content = re.sub(r'xmlns:kvg="[^"]*"', "", svg_content)
-        svg_content = re.sub(r'kvg:[a-z]+="[^"]*"', "", svg_content)
+        svg_content = cls._KVG_NS_RE.sub("", svg_content)
+        svg_content = cls._KVG_ATTR_RE.sub("", svg_content)
 
         # CRITICAL: Remove inline fill and stroke attributes for dark mode support
         # This allows CSS to control the colors
-        svg_content = re.sub(r'\s+fill="[^"]*"', "", svg_content)
-        svg_content = re.sub(r'\s+stroke="[^"]*"', "", svg_content)
+        svg_content = cls._FILL_RE.sub("", svg_content)
+        svg_content = cls._STROKE_RE.sub("", svg_content)
 
         # Keep only essential SVG content
-        svg_match = re.search(r"(<svg[^>]*>.*</svg>)", svg_content, re.DOTALL)
+        svg_match = cls._SVG_RE.search(svg_content)
         if svg_match:
             svg_content = svg_match.group(1)
 
         # Set viewBox and size - use class for theme support
-        svg_content = re.sub(
-            r"<svg([^>]*)>",
+        svg_content = cls._SVG_OPEN_RE.sub(
             '<svg viewBox="0 0 109 109" width="120" height="120" class="stroke-svg">',
             svg_content,
         )
@@ -894,6 +1498,8 @@ class TTSGenerator:
     # ja-JP-NanamiNeural (female, natural)
     # ja-JP-KeitaNeural (male, natural)
     VOICE = "ja-JP-NanamiNeural"
+    RATE_LIMIT_KEY = "speech.platform.bing.com"  # edge-tts endpoint host
+    BATCH_SIZE = 32
 
     @staticmethod
     def generate_audio(text: str, output_path: str, lang: str = "ja") -> bool:
@@ -906,10 +1512,11 @@ class TTSGenerator:
                 communicate = edge_tts.Communicate(text, TTSGenerator.VOICE)
                 await communicate.save(output_path)
 
+            RateLimiter.acquire(TTSGenerator.RATE_LIMIT_KEY)
             asyncio.run(_generate())
             return True
         except ImportError:
-            print("Installing edge-tts...")
+            logger.info("Installing edge-tts...")
             os.system("pip install edge-tts --break-system-packages")
             try:
                 import edge_tts
@@ -922,13 +1529,55 @@ class TTSGenerator:
                 asyncio.run(_generate())
                 return True
             except Exception as e:
-                print(f"TTS error: {e}")
+                logger.warning("TTS error: %s", e)
                 return False
         except Exception as e:
-            print(f"TTS error for {text}: {e}")
-            return False
+            logger.warning("TTS error for %s: %s", text, e)
             return False
 
+    @staticmethod
+    def generate_audio_batch(items: List[Tuple[str, str]], loop=None) -> List[bool]:
+        """Generate many (text, output_path) clips. Returns success per item.
+
+        Each batch of BATCH_SIZE clips is synthesized concurrently, so a batch
+        costs about one round-trip instead of one per clip. Pass a long-lived
+        event loop to reuse it (and its rate-limit wait threads) across calls.
+        """
+        try:
+            import edge_tts
+        except ImportError:
+            logger.info("Installing edge-tts...")
+            os.system("pip install edge-tts --break-system-packages")
+            try:
+                import edge_tts
+            except ImportError as e:
+                logger.warning("TTS error: %s", e)
+                return [False] * len(items)
+        import asyncio
+
+        async def _generate(text: str, output_path: str) -> bool:
+            await asyncio.to_thread(RateLimiter.acquire, TTSGenerator.RATE_LIMIT_KEY)
+            try:
+                communicate = edge_tts.Communicate(text, TTSGenerator.VOICE)
+                await communicate.save(output_path)
+                return True
+            except Exception as e:
+                logger.warning("TTS error for %s: %s", text, e)
+                # Don't leave a truncated file that later runs treat as cached
+                if os.path.exists(output_path):
+                    os.remove(output_path)
+                return False
+
+        async def _generate_batch(batch: List[Tuple[str, str]]) -> List[bool]:
+            return await asyncio.gather(*(_generate(t, p) for t, p in batch))
+
+        run = loop.run_until_complete if loop is not None else asyncio.run
+        results = []
+        size = TTSGenerator.BATCH_SIZE
+        for start in range(0, len(items), size):
+            results.extend(run(_generate_batch(items[start : start + size])))
+        return results
+
 
 # =============================================================================
 # HÁN VIỆT DATABASE
@@ -939,6 +1588,9 @@ class HanVietDB:
     """Sino-Vietnamese reading database - loads from JSON"""
 
     HANVIET_MAP: Dict[str, str] = {}
+    # ord(kanji) -> "reading " for str.translate; kana pre-mapped to None so
+    # the common misses never reach __missing__
+    _TRANSLATE: Dict[int, Optional[str]] = _DropUnmapped()
     _loaded = False
 
     @classmethod
@@ -949,22 +1601,23 @@ class HanVietDB:
 
         json_path = Path(__file__).parent / "data" / "hanviet.json"
         if json_path.exists():
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(json_path, "rb") as f:
+                data = _json_loads(f.read())
                 # Remove comment key
                 data.pop("_comment", None)
                 cls.HANVIET_MAP = data
+        cls._TRANSLATE = _DropUnmapped(dict.fromkeys(range(0x3040, 0x3100)))
+        cls._TRANSLATE.update(
+            {ord(char): reading + " " for char, reading in cls.HANVIET_MAP.items()}
+        )
         cls._loaded = True
 
     @staticmethod
     def get_hanviet(word: str) -> str:
         """Get Hán Việt reading for a word"""
         HanVietDB._load()
-        result = []
-        for char in word:
-            if char in HanVietDB.HANVIET_MAP:
-                result.append(HanVietDB.HANVIET_MAP[char])
-        return " ".join(result) if result else ""
+        # One C-level pass: kanji -> "reading ", everything else dropped
+        return word.translate(HanVietDB._TRANSLATE).rstrip()
 
 
 # =============================================================================
@@ -979,6 +1632,7 @@ class RadicalDB:
     RADICAL_BY_SYMBOL: Dict[str, Dict] = {}
     RADICAL_BY_VARIANT: Dict[str, Dict] = {}
     _jamdict = None
+    _jamdict_lock = threading.Lock()  # jamdict's sqlite handle is not thread-safe
     _jamdict_cache: Dict[str, List[str]] = {}  # kanji -> [normalized components]
     _cache_path: Path = None
     _loaded = False
@@ -1003,8 +1657,8 @@ class RadicalDB:
             # Fallback to old JSON if new file not available
             json_path = Path(__file__).parent / "data" / "radicals.json"
             if json_path.exists():
-                with open(json_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(json_path, "rb") as f:
+                    data = _json_loads(f.read())
                     data.pop("_comment", None)
                     for symbol, info in data.items():
                         rad = {
@@ -1024,10 +1678,12 @@ class RadicalDB:
         cls._cache_path = Path(__file__).parent / "data" / "jamdict_cache.json"
         if cls._cache_path.exists():
             try:
-                with open(cls._cache_path, "r", encoding="utf-8") as f:
-                    cls._jamdict_cache = json.load(f)
+                with open(cls._cache_path, "rb") as f:
+                    cls._jamdict_cache = _json_loads(f.read())
             except:
                 cls._jamdict_cache = {}
+        # Save the cache on exit (also when the run is interrupted)
+        atexit.register(cls._save_cache)
 
         # Initialize jamdict for accurate radical lookup
         try:
@@ -1035,7 +1691,7 @@ class RadicalDB:
 
             cls._jamdict = Jamdict()
         except ImportError:
-            print("Warning: jamdict not installed, using fallback radical detection")
+            logger.warning("jamdict not installed, using fallback radical detection")
             cls._jamdict = None
 
         cls._loaded = True
@@ -1046,7 +1702,7 @@ class RadicalDB:
         if cls._cache_path and cls._jamdict_cache:
             try:
                 with open(cls._cache_path, "w", encoding="utf-8") as f:
-                    json.dump(cls._jamdict_cache, f, ensure_ascii=False, indent=2)
+                    _json_dump(cls._jamdict_cache, f, indent=True)
             except:
                 pass
 
@@ -1063,7 +1719,8 @@ class RadicalDB:
         components = []
         if cls._jamdict:
             try:
-                result = cls._jamdict.lookup(kanji)
+                with cls._jamdict_lock:
+                    result = cls._jamdict.lookup(kanji)
                 if result.chars:
                     raw_comps = result.chars[0].components or []
                     components = [unicodedata.normalize("NFKC", c) for c in raw_comps]
@@ -1074,6 +1731,13 @@ class RadicalDB:
 
         return components
 
+    @classmethod
+    def prefetch(cls, kanji_chars):
+        """Resolve radicals for many kanji in one sequential jamdict sweep"""
+        cls._load()
+        for kanji in kanji_chars:
+            cls.identify_all_radicals(kanji)
+
     @classmethod
     def get_importance_label(cls, frequency: int, joyo_freq: int) -> str:
         """Determine importance based on frequency data"""
@@ -1101,7 +1765,8 @@ class RadicalDB:
         # Use jamdict for accurate radical lookup
         if cls._jamdict:
             try:
-                result = cls._jamdict.lookup(kanji)
+                with cls._jamdict_lock:
+                    result = cls._jamdict.lookup(kanji)
                 if result.chars:
                     char_info = result.chars[0]
 
@@ -1144,18 +1809,22 @@ class RadicalDB:
             except Exception as e:
                 pass  # Fall through to fallback
 
-        # Fallback: check if any radical/variant is substring
-        for variant, rad in cls.RADICAL_BY_VARIANT.items():
-            if variant in kanji:
-                return {"radical": rad["symbol"], "found_as": variant, **rad}
+        # Fallback: radical/variant characters inside the string, looked up
+        # per character in the symbol/variant indexes (radicals are 1 char)
+        for char in kanji:
+            rad = cls.RADICAL_BY_VARIANT.get(char)
+            if rad:
+                return {"radical": rad["symbol"], "found_as": char, **rad}
 
-        for symbol, rad in cls.RADICAL_BY_SYMBOL.items():
-            if symbol in kanji and symbol != kanji:
-                return {"radical": symbol, **rad}
+        for char in kanji:
+            rad = cls.RADICAL_BY_SYMBOL.get(char)
+            if rad and char != kanji:
+                return {"radical": char, **rad}
 
         return {}
 
     @classmethod
+    @functools.lru_cache(maxsize=4096)
     def identify_all_radicals(cls, kanji: str) -> List[Dict]:
         """Identify ALL component radicals of a kanji (not just main radical)"""
         cls._load()
@@ -1212,8 +1881,8 @@ class KanjiFrequencyDB:
 
         json_path = Path(__file__).parent / "data" / "kanji_frequency.json"
         if json_path.exists():
-            with open(json_path, "r", encoding="utf-8") as f:
-                cls.FREQ = json.load(f)
+            with open(json_path, "rb") as f:
+                cls.FREQ = _json_loads(f.read())
         cls._loaded = True
 
     @classmethod
@@ -1226,6 +1895,10 @@ class KanjiFrequencyDB:
     def get_word_frequency(cls, word: str) -> Dict:
         """Get frequency info for first kanji in word with frequency data"""
         cls._load()
+        # One C-level pass for the common no-hit case (kana-only words).
+        # Keys aren't all in _KANJI_RE's range (𠮟), so test the keys.
+        if cls.FREQ.keys().isdisjoint(word):
+            return {}
         for char in word:
             if char in cls.FREQ:
                 return {**cls.FREQ[char], "kanji": char}
@@ -1250,8 +1923,8 @@ class JLPTDB:
 
         json_path = Path(__file__).parent / "data" / "jlpt.json"
         if json_path.exists():
-            with open(json_path, "r", encoding="utf-8") as f:
-                cls.LEVELS = json.load(f)
+            with open(json_path, "rb") as f:
+                cls.LEVELS = _json_loads(f.read())
         cls._loaded = True
 
     @classmethod
@@ -1271,6 +1944,11 @@ class FuriganaGenerator:
 
     _kakasi = None
 
+    # Alternating kanji / non-kanji runs, found in one regex scan
+    _SEGMENT_RE = re.compile(r"[\u4e00-\u9fff]+|[^\u4e00-\u9fff]+")
+    # Whole katakana block shifted down to hiragana (-0x60)
+    _KATA_TO_HIRA = {c: c - 0x60 for c in range(0x30A0, 0x3100)}
+
     @classmethod
     def _init_kakasi(cls):
         """Initialize pykakasi (lazy loading)"""
@@ -1310,14 +1988,7 @@ class FuriganaGenerator:
     @classmethod
     def _katakana_to_hiragana(cls, text: str) -> str:
         """Convert katakana to hiragana for comparison"""
-        result = []
-        for c in text:
-            if cls._is_katakana(c):
-                # Katakana to hiragana: subtract 0x60
-                result.append(chr(ord(c) - 0x60))
-            else:
-                result.append(c)
-        return "".join(result)
+        return text.translate(cls._KATA_TO_HIRA)
 
     @classmethod
     def _validate_reading(cls, word: str, reading: str) -> str:
@@ -1340,7 +2011,7 @@ class FuriganaGenerator:
         )  # Half-width and full-width spaces
 
         # Count kana in word
-        word_kanji = sum(1 for c in word if cls._is_kanji(c))
+        word_kanji = len(_KANJI_RE.findall(word))
         word_kana = sum(1 for c in word if cls._is_hiragana(c) or cls._is_katakana(c))
 
         # If no kanji, no need to validate
@@ -1397,8 +2068,7 @@ class FuriganaGenerator:
         - 彼女のドレス → <ruby>彼女<rt>かのじょ</rt></ruby>のドレス
         """
         # If word is all hiragana/katakana, no furigana needed
-        has_kanji = any(cls._is_kanji(c) for c in word)
-        if not has_kanji:
+        if not _KANJI_RE.search(word):
             return word
 
         # Validate and fix reading if needed
@@ -1415,25 +2085,9 @@ class FuriganaGenerator:
                 return word
 
         # Segment word into blocks: kanji vs kana (hiragana/katakana)
-        segments = []  # List of (text, is_kanji)
-        current = ""
-        current_is_kanji = None
-
-        for c in word:
-            is_kanji = cls._is_kanji(c)
-            if current_is_kanji is None:
-                current_is_kanji = is_kanji
-
-            if is_kanji == current_is_kanji:
-                current += c
-            else:
-                if current:
-                    segments.append((current, current_is_kanji))
-                current = c
-                current_is_kanji = is_kanji
-
-        if current:
-            segments.append((current, current_is_kanji))
+        segments = [  # List of (text, is_kanji)
+            (seg, cls._is_kanji(seg[0])) for seg in cls._SEGMENT_RE.findall(word)
+        ]
 
         # If only one segment and it's all kanji, simple wrap
         if len(segments) == 1 and segments[0][1]:
@@ -1512,8 +2166,7 @@ class FuriganaGenerator:
     @classmethod
     def generate_per_char(cls, word: str, reading: str) -> str:
         """Try to generate per-character furigana (best effort)"""
-        has_kanji = any(cls._is_kanji(c) for c in word)
-        if not has_kanji:
+        if not _KANJI_RE.search(word):
             return word
 
         # If single kanji, simple wrap
@@ -1550,11 +2203,41 @@ class SentenceFuriganaGenerator:
 
                 cls._kakasi = pykakasi.kakasi()
             except ImportError:
-                print(
-                    "Warning: pykakasi not installed. Run: pip install pykakasi --break-system-packages"
+                logger.warning(
+                    "pykakasi not installed. Run: pip install pykakasi --break-system-packages"
                 )
                 cls._kakasi = False
 
+    @classmethod
+    def _render(cls, convert, sentence: str) -> str:
+        """Furigana HTML for one sentence, given a bound kakasi.convert"""
+        if not sentence:
+            return sentence
+
+        kanji_search = _KANJI_RE.search
+        overrides = cls.READING_OVERRIDES
+
+        def _fmt(item) -> str:
+            orig = item["orig"]
+            hira = item["hira"]
+            # Plain text unless the token has kanji with a distinct reading
+            if orig == hira or kanji_search(orig) is None:
+                return orig
+
+            # Check for reading overrides
+            # Extract just the kanji part for lookup
+            kanji_only = "".join(_KANJI_RE.findall(orig))
+            if kanji_only in overrides:
+                # Override the reading, keeping any trailing kana from orig
+                hira = overrides[kanji_only] + _KANJI_RE.sub("", orig)
+            return f"<ruby>{orig}<rt>{hira}</rt></ruby>"
+
+        try:
+            return "".join(map(_fmt, convert(sentence)))
+        except Exception as e:
+            # Fallback to original sentence
+            return sentence
+
     @classmethod
     def generate(cls, sentence: str) -> str:
         """Generate furigana HTML for a sentence"""
@@ -1562,40 +2245,18 @@ class SentenceFuriganaGenerator:
 
         if cls._kakasi is False or not sentence:
             return sentence
+        return cls._render(cls._kakasi.convert, sentence)
 
-        try:
-            result = cls._kakasi.convert(sentence)
-            html_parts = []
-
-            for item in result:
-                orig = item["orig"]
-                hira = item["hira"]
-
-                # Check if has kanji
-                has_kanji = any("\u4e00" <= c <= "\u9fff" for c in orig)
-
-                if has_kanji and orig != hira:
-                    # Check for reading overrides
-                    # Extract just the kanji part for lookup
-                    kanji_only = "".join(c for c in orig if "\u4e00" <= c <= "\u9fff")
-
-                    if kanji_only in cls.READING_OVERRIDES:
-                        # Override the reading
-                        correct_reading = cls.READING_OVERRIDES[kanji_only]
-                        # Preserve any trailing kana from orig
-                        trailing_kana = "".join(
-                            c for c in orig if not ("\u4e00" <= c <= "\u9fff")
-                        )
-                        hira = correct_reading + trailing_kana
-
-                    html_parts.append(f"<ruby>{orig}<rt>{hira}</rt></ruby>")
-                else:
-                    html_parts.append(orig)
+    @classmethod
+    def generate_batch(cls, sentences: List[str]) -> List[str]:
+        """Furigana HTML for many sentences - kakasi init/lookup done once"""
+        cls._init_kakasi()
 
-            return "".join(html_parts)
-        except Exception as e:
-            # Fallback to original sentence
-            return sentence
+        if cls._kakasi is False:
+            return list(sentences)
+        convert = cls._kakasi.convert
+        render = cls._render
+        return [render(convert, s) for s in sentences]
 
 
 # =============================================================================
@@ -1725,6 +2386,15 @@ class VerbConjugator:
         },
     }
 
+    # Ichidan endings, appended to the stem (word minus る)
+    ICHIDAN_ENDINGS = {
+        "masu": "ます",
+        "te": "て",
+        "ta": "た",
+        "nai": "ない",
+        "potential": "られる",
+    }
+
     # Common ichidan (る) verbs that end in える/いる
     ICHIDAN_COMMON = {
         "食べる",
@@ -1752,12 +2422,21 @@ class VerbConjugator:
         "しめる",
     }
 
+    # word_type markers (English, Japanese, Vietnamese)
+    _VERB_MARKERS = ("Verb", "動詞", "Động từ", "verb")
+    _ICHIDAN_MARKERS = ("Ichidan", "ichidan", "一段")
+    _GODAN_MARKERS = ("Godan", "godan", "五段")
+    # え-row: え, け, せ, て, ね, へ, め, れ, げ, ぜ, で, べ, ぺ
+    _E_ROW = frozenset("えけせてねへめれげぜでべぺ")
+    # い-row: い, き, し, ち, に, ひ, み, り, ぎ, じ, ぢ, び, ぴ
+    _I_ROW = frozenset("いきしちにひみりぎじぢびぴ")
+
     @classmethod
+    @functools.lru_cache(maxsize=4096)
     def detect_verb_type(cls, word: str, word_type: str = "") -> str:
         """Detect verb type: ichidan, godan, irregular, or not_verb"""
         # Check if it's marked as a verb (English, Japanese, or Vietnamese)
-        verb_markers = ["Verb", "動詞", "Động từ", "verb"]
-        if word_type and not any(m in word_type for m in verb_markers):
+        if word_type and not any(m in word_type for m in cls._VERB_MARKERS):
             return "not_verb"
 
         # Check irregulars first
@@ -1769,13 +2448,10 @@ class VerbConjugator:
             return "suru"
 
         # Detect from word_type string
-        ichidan_markers = ["Ichidan", "ichidan", "一段"]
-        godan_markers = ["Godan", "godan", "五段"]
-
         if word_type:
-            if any(m in word_type for m in ichidan_markers):
+            if any(m in word_type for m in cls._ICHIDAN_MARKERS):
                 return "ichidan"
-            if any(m in word_type for m in godan_markers):
+            if any(m in word_type for m in cls._GODAN_MARKERS):
                 return "godan"
 
         # Check common ichidan verbs
@@ -1791,11 +2467,7 @@ class VerbConjugator:
         # Ichidan verbs end in る with え-row or い-row vowel before
         if last_char == "る" and len(word) >= 2:
             prev_char = word[-2]
-            # え-row: え, け, せ, て, ね, へ, め, れ, げ, ぜ, で, べ, ぺ
-            e_row = "えけせてねへめれげぜでべぺ"
-            # い-row: い, き, し, ち, に, ひ, み, り, ぎ, じ, ぢ, び, ぴ
-            i_row = "いきしちにひみりぎじぢびぴ"
-            if prev_char in e_row or prev_char in i_row:
+            if prev_char in cls._E_ROW or prev_char in cls._I_ROW:
                 # Could be ichidan - but many are actually godan
                 # Default to ichidan for common patterns
                 return "ichidan"
@@ -1807,10 +2479,12 @@ class VerbConjugator:
         return "not_verb"
 
     @classmethod
+    @functools.lru_cache(maxsize=4096)
     def conjugate(
         cls, word: str, reading: str = "", word_type: str = ""
     ) -> Dict[str, str]:
         """Conjugate a verb. Returns dict with masu, te, ta, nai, potential forms"""
+        # Memoized: the returned dict is shared between calls, do not mutate
         verb_type = cls.detect_verb_type(word, word_type)
 
         if verb_type == "not_verb":
@@ -1839,24 +2513,12 @@ class VerbConjugator:
 
         # Ichidan verbs - just drop る and add endings
         if verb_type == "ichidan":
-            return {
-                "masu": f"{stem}ます",
-                "te": f"{stem}て",
-                "ta": f"{stem}た",
-                "nai": f"{stem}ない",
-                "potential": f"{stem}られる",
-            }
+            return {k: stem + v for k, v in cls.ICHIDAN_ENDINGS.items()}
 
         # Godan verbs
         if verb_type == "godan" and last_char in cls.GODAN_ENDINGS:
             endings = cls.GODAN_ENDINGS[last_char]
-            return {
-                "masu": f"{stem}{endings['masu']}",
-                "te": f"{stem}{endings['te']}",
-                "ta": f"{stem}{endings['ta']}",
-                "nai": f"{stem}{endings['nai']}",
-                "potential": f"{stem}{endings['potential']}",
-            }
+            return {k: stem + v for k, v in endings.items()}
 
         return {}
 
@@ -1877,11 +2539,11 @@ class VerbConjugator:
             "nai": "Phủ định",
             "potential": "Khả năng",
         }
-        for key in ["masu", "te", "ta", "nai", "potential"]:
-            if key in conj:
-                # Add furigana to conjugated form
-                conj_with_ruby = SentenceFuriganaGenerator.generate(conj[key])
-                parts.append(f"{labels[key]}: {conj_with_ruby}")
+        keys = [k for k in ("masu", "te", "ta", "nai", "potential") if k in conj]
+        # Add furigana to all conjugated forms in one batch
+        forms = SentenceFuriganaGenerator.generate_batch([conj[k] for k in keys])
+        for key, conj_with_ruby in zip(keys, forms):
+            parts.append(f"{labels[key]}: {conj_with_ruby}")
         return " | ".join(parts)
 
 
@@ -1891,7 +2553,14 @@ class ExampleSentencesDB:
     SENTENCES: Dict[str, List[List[str]]] = {}
     _loaded = False
     _cache_dir: Path = None
-    last_api_called: bool = False
+    _memory_cache: Dict[str, List[str]] = {}  # word -> examples from cache/API
+    _cache_names: Optional[set] = None  # legacy examples_cache listing (bulk)
+    _api_called = _ThreadFlag()  # see was_api_called()
+
+    @classmethod
+    def was_api_called(cls) -> bool:
+        """Whether this thread's last lookup went to the API (not the cache)"""
+        return cls._api_called.value
 
     @classmethod
     def _load(cls):
@@ -1904,8 +2573,8 @@ class ExampleSentencesDB:
 
         json_path = Path(__file__).parent / "data" / "example_sentences.json"
         if json_path.exists():
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(json_path, "rb") as f:
+                data = _json_loads(f.read())
                 data.pop("_comment", None)
                 cls.SENTENCES = data
         cls._loaded = True
@@ -1916,38 +2585,26 @@ class ExampleSentencesDB:
     ) -> List[str]:
         """Get example sentences for a word"""
         cls._load()
-        cls.last_api_called = False
-
-        # Build search variations
-        search_words = [word]
-
-        # For suru verbs: 失敗する → also try 失敗
-        if word.endswith("する"):
-            search_words.append(word[:-2])
-        elif word.endswith("す"):
-            search_words.append(word[:-1])
-
-        # For Katakana words: add hiragana version
-        # コンピューター → こんぴゅーたー
-        if cls._is_katakana_word(word):
-            hiragana = cls._katakana_to_hiragana(word)
-            if hiragana and hiragana != word:
-                search_words.append(hiragana)
+        cls._api_called.value = False
 
+        search_words = cls._search_words(word)
         for search_word in search_words:
             if search_word in cls.SENTENCES:
                 examples = cls.SENTENCES[search_word][:limit]
                 return [f"{jp} → {vi}" for jp, vi in examples]
 
-        # Check cache - use stable hash
-        word_hash = hashlib.md5(word.encode()).hexdigest()[:12]
-        cache_file = cls._cache_dir / f"{word_hash}.json"
-        if cache_file and cache_file.exists():
+        if word in cls._memory_cache:
+            return cls._memory_cache[word][:limit]
+
+        # Check cache (SQLite, then the old per-word file)
+        word_hash = _cache_name(word)
+        cached = CacheDB.get("examples", word, cls._cache_dir / f"{word_hash}.json")
+        if cached is not None:
             try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    cached = json.load(f)
-                    if cached:  # Only return if not empty
-                        return cached[:limit]
+                cached = _json_loads(cached)
+                if cached:  # Only return if not empty
+                    cls._memory_cache[word] = cached
+                    return cached[:limit]
             except:
                 pass
 
@@ -1956,7 +2613,7 @@ class ExampleSentencesDB:
             return []
 
         # Fetch from APIs - try each variation
-        cls.last_api_called = True
+        cls._api_called.value = True
         examples = []
 
         for search_word in search_words:
@@ -1971,14 +2628,77 @@ class ExampleSentencesDB:
                 break
 
         # Save to cache (including empty to avoid re-fetching)
-        if cache_file:
+        cls._memory_cache[word] = examples
+        CacheDB.put("examples", word, _json_dumpb(examples))
+
+        return examples
+
+    @classmethod
+    def get_examples_bulk(
+        cls, words: List[str], limit: int = 2
+    ) -> Dict[str, List[str]]:
+        """Resolve examples for many words at once (e.g. one chapter), no API.
+
+        Cached words come from the SQLite cache in bulk queries; the legacy
+        cache directory is listed once and only the files that exist there
+        are imported. The later per-entry get_examples() calls for these
+        words are then pure memory hits. Words found neither locally nor in
+        the cache are left out; get_examples() fetches them as usual.
+        """
+        cls._load()
+        if cls._cache_names is None:
+            with os.scandir(cls._cache_dir) as it:
+                cls._cache_names = {e.name for e in it}
+
+        pending = [
+            word
+            for word in dict.fromkeys(words)
+            if word not in cls._memory_cache
+            and not any(w in cls.SENTENCES for w in cls._search_words(word))
+        ]
+        stored = CacheDB.get_many("examples", pending)
+        for word in pending:
+            raw = stored.get(word)
+            if raw is None:
+                name = f"{_cache_name(word)}.json"
+                if name not in cls._cache_names:
+                    continue
+                raw = CacheDB.get("examples", word, cls._cache_dir / name)
+                if raw is None:
+                    continue
             try:
-                with open(cache_file, "w", encoding="utf-8") as f:
-                    json.dump(examples, f, ensure_ascii=False)
+                cached = _json_loads(raw)
+                if cached:  # Empty = retry the API, same as get_examples
+                    cls._memory_cache[word] = cached
             except:
                 pass
 
-        return examples
+        found = {}
+        for word in words:
+            examples = cls.get_examples(word, limit, offline=True)
+            if examples:
+                found[word] = examples
+        return found
+
+    @classmethod
+    def _search_words(cls, word: str) -> List[str]:
+        """Word plus the variations tried against the local DB and APIs"""
+        search_words = [word]
+
+        # For suru verbs: 失敗する → also try 失敗
+        if word.endswith("する"):
+            search_words.append(word[:-2])
+        elif word.endswith("す"):
+            search_words.append(word[:-1])
+
+        # For Katakana words: add hiragana version
+        # コンピューター → こんぴゅーたー
+        if cls._is_katakana_word(word):
+            hiragana = cls._katakana_to_hiragana(word)
+            if hiragana and hiragana != word:
+                search_words.append(hiragana)
+
+        return search_words
 
     @staticmethod
     def _is_katakana_word(word: str) -> bool:
@@ -2010,9 +2730,9 @@ class ExampleSentencesDB:
         try:
             # Try Vietnamese first
             url = f"https://tatoeba.org/en/api_v0/search?from=jpn&to=vie&query={urllib.parse.quote(word)}&limit={limit}"
-            response = requests.get(url, timeout=5)
+            response = RateLimiter.get(url, timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 results = []
                 for item in data.get("results", [])[:limit]:
                     jp = item.get("text", "")
@@ -2026,9 +2746,9 @@ class ExampleSentencesDB:
 
             # Fallback to English if no Vietnamese
             url = f"https://tatoeba.org/en/api_v0/search?from=jpn&to=eng&query={urllib.parse.quote(word)}&limit={limit}"
-            response = requests.get(url, timeout=5)
+            response = RateLimiter.get(url, timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 results = []
                 for item in data.get("results", [])[:limit]:
                     jp = item.get("text", "")
@@ -2048,7 +2768,7 @@ class ExampleSentencesDB:
         try:
             url = f"https://jisho.org/search/{urllib.parse.quote(word)}%20%23sentences"
             headers = {"User-Agent": "Mozilla/5.0 (compatible; AnkiDeckGenerator/1.0)"}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = RateLimiter.get(url, headers=headers, timeout=10)
 
             if response.status_code == 200:
                 results = []
@@ -2104,8 +2824,8 @@ class KanjiDB:
 
         json_path = Path(__file__).parent / "data" / "kanji_database.json"
         if json_path.exists():
-            with open(json_path, "r", encoding="utf-8") as f:
-                cls.DATABASE = json.load(f)
+            with open(json_path, "rb") as f:
+                cls.DATABASE = _json_loads(f.read())
         cls._loaded = True
 
     @classmethod
@@ -2127,22 +2847,35 @@ class KanjiDB:
             "tu_ghep": [],
             "chi_tiet": [],
         }
+        # Every key is a kanji: kana-only words can't match anything
+        if not _KANJI_RE.search(word):
+            return result
 
+        db_get = cls.DATABASE.get
+        han_viet, pinyin, kun, on, tu_ghep, chi_tiet = result.values()
         for char in word:
-            info = cls.DATABASE.get(char, {})
-            if info:
-                if info.get("han_viet"):
-                    result["han_viet"].append(f"{char}({info['han_viet']})")
-                if info.get("pinyin"):
-                    result["pinyin"].append(info["pinyin"])
-                if info.get("kun"):
-                    result["kun"].append(info["kun"])
-                if info.get("on"):
-                    result["on"].append(info["on"])
-                if info.get("tu_ghep"):
-                    result["tu_ghep"].extend(info["tu_ghep"][:2])
-                if info.get("chi_tiet"):
-                    result["chi_tiet"].append(f"【{char}】{info['chi_tiet']}")
+            info = db_get(char)
+            if not info:
+                continue
+            # One lookup per field; most fields are often missing
+            value = info.get("han_viet")
+            if value:
+                han_viet.append(f"{char}({value})")
+            value = info.get("pinyin")
+            if value:
+                pinyin.append(value)
+            value = info.get("kun")
+            if value:
+                kun.append(value)
+            value = info.get("on")
+            if value:
+                on.append(value)
+            value = info.get("tu_ghep")
+            if value:
+                tu_ghep.extend(value[:2])
+            value = info.get("chi_tiet")
+            if value:
+                chi_tiet.append(f"【{char}】{value}")
 
         return result
 
@@ -2152,20 +2885,70 @@ class KanjiDB:
 # =============================================================================
 
 
+class CachedJsonModel(genanki.Model):
+    """genanki.Model that serializes once per export instead of once per deck
+
+    genanki's Deck.write_to_db calls model.to_json() for every deck; all our
+    decks share one model, so the JSON (CSS + templates) is reused within a
+    write. Only the default deck id ("did") differs, which Anki ignores.
+    """
+
+    _json_cache: Optional[Tuple[float, Dict]] = None
+
+    def to_json(self, timestamp: float, deck_id: int) -> Dict:
+        if self._json_cache is None or self._json_cache[0] != timestamp:
+            self._json_cache = (timestamp, super().to_json(timestamp, deck_id))
+        return self._json_cache[1]
+
+
 class AnkiDeckGenerator:
     """Generate Anki deck with custom note type"""
 
-    # Unique IDs for model and deck (generate once, keep consistent)
-    MODEL_ID = 1607392319
+    # Unique IDs for model and deck (generate once, keep consistent).
+    # Bump MODEL_ID (and the model name) whenever the field list changes:
+    # Anki can't update an existing note type's fields on import.
+    # 1607392319: v1, before TakobotoLink was dropped and Synonyms/Antonyms
+    # were merged into RelatedWords
+    MODEL_ID = 1907747741
     DECK_ID_BASE = 2059400110
+    # add_entries_bulk: chapters submitted but not yet collected
+    MAX_CHAPTERS_IN_FLIGHT = 16
 
     def __init__(self, deck_name: str = "Japanese Vocabulary"):
         self.deck_name = deck_name
         self.model = self._create_model()
-        self.decks = {}  # chapter_name -> genanki.Deck
-        self.media_files = []  # List of media files to include
+        # chapter_name -> (deck_id, deck_name, notes); Decks are built in export()
+        self._chapters: Dict[str, Tuple[int, str, List[genanki.Note]]] = {}
+        # Media files to include - ordered set (dict keys): shared audio is
+        # listed once instead of once per entry that uses it
+        self.media_files: Dict[str, None] = {}
+        self._dir_contents: Dict[str, frozenset] = {}  # dir -> known file names
+        # dir -> live set of produced file names, kept up to date by the caller
+        self._known_media: Dict[str, set] = {}
+        self._tag_cache: Dict[Tuple[str, str], Tuple[str, str]] = {}
+
+    def register_media_dir(self, directory, names: set):
+        """Trust `names` as the complete content of `directory` (no stat calls)"""
+        self._known_media[str(directory)] = names
+
+    def _exists(self, path: str) -> bool:
+        """Check file existence via a one-time listing of its parent directory"""
+        directory = os.path.dirname(path) or "."
+        known = self._known_media.get(directory)
+        if known is not None:
+            return os.path.basename(path) in known
+        if directory not in self._dir_contents:
+            self._dir_contents[directory] = (
+                frozenset(os.listdir(directory))
+                if os.path.isdir(directory)
+                else frozenset()
+            )
+        if os.path.basename(path) in self._dir_contents[directory]:
+            return True
+        # Files generated after the listing (fresh TTS) are not in the snapshot
+        return os.path.exists(path)
 
-    def _create_model(self) -> genanki.Model:
+    def _create_model(self) -> CachedJsonModel:
         """Create custom Anki note type with all fields"""
 
         # CSS styling
@@ -2620,8 +3403,7 @@ hr {
     {{#RadicalInfo}}<div class="radical">🔠 Bộ thủ: {{RadicalInfo}}</div>{{/RadicalInfo}}
     {{#FrequencyInfo}}<div class="frequency-info">Tần suất: {{FrequencyInfo}}</div>{{/FrequencyInfo}}
     {{#Conjugations}}<div class="conjugations">🔄 {{Conjugations}}</div>{{/Conjugations}}
-    {{#Synonyms}}<div class="synonyms">≈ Đồng nghĩa: {{Synonyms}}</div>{{/Synonyms}}
-    {{#Antonyms}}<div class="antonyms">≠ Trái nghĩa: {{Antonyms}}</div>{{/Antonyms}}
+    {{#RelatedWords}}{{RelatedWords}}{{/RelatedWords}}
     {{#KanjiChiTiet}}
     <div class="kanji-detail-separator"></div>
     <div class="kanji-detail-title">📚 Chiết tự Hán</div>
@@ -2644,7 +3426,7 @@ hr {
 {{/Examples}}
 
 <div class="dictionary-link">
-    <a href="{{TakobotoLink}}" target="_blank">📖 Takoboto</a>
+    <a href="https://takoboto.jp/?q={{Word}}" target="_blank">📖 Takoboto</a>
 </div>
 
 <div class="tags">{{Chapter}} / {{SubCategory}}</div>
@@ -2676,15 +3458,15 @@ hr {
 {{#Conjugations}}<div class="conjugations">🔄 {{Conjugations}}</div>{{/Conjugations}}
 
 <div class="dictionary-link">
-    <a href="{{TakobotoLink}}" target="_blank">📖 Takoboto</a>
+    <a href="https://takoboto.jp/?q={{Word}}" target="_blank">📖 Takoboto</a>
 </div>
 
 <div class="tags">{{Chapter}} / {{SubCategory}}</div>
 """
 
-        return genanki.Model(
+        return CachedJsonModel(
             self.MODEL_ID,
-            "Japanese Vocabulary Enhanced",
+            "Japanese Vocabulary Enhanced v2",
             fields=[
                 {"name": "Word"},
                 {"name": "Reading"},
@@ -2706,14 +3488,13 @@ hr {
                 {"name": "KanjiChiTiet"},
                 {"name": "Chapter"},
                 {"name": "SubCategory"},
-                {"name": "TakobotoLink"},
                 # New fields
                 {"name": "JLPTLevel"},
                 {"name": "WordType"},
                 {"name": "Furigana"},
                 {"name": "Conjugations"},
-                {"name": "Synonyms"},
-                {"name": "Antonyms"},
+                # Synonyms + antonyms (antonyms are on <1% of notes)
+                {"name": "RelatedWords"},
             ],
             templates=[
                 {
@@ -2730,24 +3511,38 @@ hr {
             css=css,
         )
 
-    def add_entry(self, entry: VocabEntry, chapter: str):
-        """Add a vocabulary entry to the appropriate deck"""
-        # Create deck if not exists
-        if chapter not in self.decks:
+    def _chapter_notes(self, chapter: str) -> List[genanki.Note]:
+        """Get or create the note list for a chapter's deck"""
+        if chapter not in self._chapters:
             deck_id = self.DECK_ID_BASE + hash(chapter) % 1000000
-            deck = genanki.Deck(deck_id, f"{self.deck_name}::{chapter}")
-            self.decks[chapter] = deck
+            self._chapters[chapter] = (deck_id, f"{self.deck_name}::{chapter}", [])
+        return self._chapters[chapter][2]
 
-        # Build tags
-        tags = [
-            entry.chapter.replace(" ", "_"),
-            entry.sub_category.replace(" ", "_") if entry.sub_category else "",
-        ]
-        if entry.jlpt_level:
-            tags.append(entry.jlpt_level)  # Add JLPT level as tag for filtering
+    @staticmethod
+    def _note_guid(*values: str) -> str:
+        """Stable note GUID - short blake2b digest instead of genanki's default"""
+        return hashlib.blake2b("__".join(values).encode(), digest_size=8).hexdigest()
+
+    def _build_note(self, entry: VocabEntry) -> genanki.Note:
+        """Build the Anki note for a vocabulary entry"""
+        # Shared across thousands of notes - keep one copy of each string
+        chapter = sys.intern(entry.chapter or "")
+        sub_category = sys.intern(entry.sub_category or "")
+        jlpt_level = sys.intern(entry.jlpt_level or "")
+
+        # Build tags - (chapter, sub-category) prefix computed once per pair
+        key = (chapter, sub_category)
+        base_tags = self._tag_cache.get(key)
+        if base_tags is None:
+            base_tags = self._tag_cache.setdefault(
+                key, (chapter.replace(" ", "_"), sub_category.replace(" ", "_"))
+            )
+        if jlpt_level:
+            tags = [*base_tags, jlpt_level]  # JLPT level as tag for filtering
+        else:
+            tags = list(base_tags)
 
-        # Create note
-        note = genanki.Note(
+        return genanki.Note(
             model=self.model,
             fields=[
                 entry.word or "",
@@ -2768,42 +3563,102 @@ hr {
                 entry.kanji_on or "",
                 entry.kanji_tu_ghep or "",
                 entry.kanji_chi_tiet or "",
-                entry.chapter or "",
-                entry.sub_category or "",
-                entry.takoboto_link or "",
-                entry.jlpt_level or "",
+                chapter,
+                sub_category,
+                jlpt_level,
                 entry.word_type or "",
                 entry.furigana or "",
                 entry.conjugations or "",
-                entry.synonyms or "",
-                entry.antonyms or "",
+                self._related_words_html(entry),
             ],
             tags=tags,
+            # Identity = word + meaning + chapter, so re-imports update the
+            # existing note instead of duplicating it when enrichment changes
+            guid=self._note_guid(entry.word, entry.meaning_vi, entry.chapter),
         )
 
-        self.decks[chapter].add_note(note)
+    @staticmethod
+    def _related_words_html(entry: VocabEntry) -> str:
+        """Render synonyms/antonyms into the single RelatedWords field"""
+        parts = []
+        if entry.synonyms:
+            parts.append(f'<div class="synonyms">≈ Đồng nghĩa: {entry.synonyms}</div>')
+        if entry.antonyms:
+            parts.append(f'<div class="antonyms">≠ Trái nghĩa: {entry.antonyms}</div>')
+        return "".join(parts)
+
+    def _collect_media(self, entry: VocabEntry) -> List[str]:
+        """List the media files (word + example audio) used by an entry"""
+        media = []
 
         # Track audio file
-        if entry.audio_file and os.path.exists(entry.audio_file):
-            self.media_files.append(entry.audio_file)
+        if entry.audio_file and self._exists(entry.audio_file):
+            media.append(entry.audio_file)
 
             # Track example audio files (inline in entry.examples)
             if entry.examples:
-                import re
-
                 examples_dir = Path(entry.audio_file).parent.parent / "examples"
                 for match in re.findall(r"\[sound:([^\]]+)\]", entry.examples):
                     audio_path = examples_dir / match
-                    if audio_path.exists():
-                        self.media_files.append(str(audio_path))
+                    if self._exists(str(audio_path)):
+                        media.append(str(audio_path))
+
+        return media
+
+    def add_entry(self, entry: VocabEntry, chapter: str):
+        """Add a vocabulary entry to the appropriate deck"""
+        self._chapter_notes(chapter).append(self._build_note(entry))
+        self.media_files.update(dict.fromkeys(self._collect_media(entry)))
+
+    def add_entries_bulk(self, entries: Iterable[Tuple[VocabEntry, str]]):
+        """Add many (entry, chapter) pairs, building each chapter's notes in parallel
+
+        entries may be a generator: it is consumed one chapter at a time, each
+        run of same-chapter entries going to a worker as soon as the next
+        chapter starts. At most MAX_CHAPTERS_IN_FLIGHT chapter lists exist at
+        once; the oldest chapter's notes are collected (and its entry list
+        released) before more input is read. Notes are appended to the decks
+        in the original chapter order.
+        """
+
+        def _build_chapter(chapter_entries: List[VocabEntry]):
+            notes = []
+            media = []
+            for entry in chapter_entries:
+                notes.append(self._build_note(entry))
+                media.extend(self._collect_media(entry))
+            return notes, media
+
+        def _collect(chapter: str, future):
+            notes, media = future.result()
+            self._chapter_notes(chapter).extend(notes)
+            self.media_files.update(dict.fromkeys(media))
+
+        pending = collections.deque()  # (chapter, future) in chapter order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for chapter, group in itertools.groupby(entries, key=lambda p: p[1]):
+                pending.append(
+                    (chapter, executor.submit(_build_chapter, [e for e, _ in group]))
+                )
+                if len(pending) >= self.MAX_CHAPTERS_IN_FLIGHT:
+                    _collect(*pending.popleft())
+            while pending:
+                _collect(*pending.popleft())
 
     def export(self, output_path: str):
         """Export all decks to a single .apkg file"""
+        # Materialize decks only now
+        decks = []
+        for deck_id, deck_name, notes in self._chapters.values():
+            deck = genanki.Deck(deck_id, deck_name)
+            deck.notes = notes
+            decks.append(deck)
+
         # Create package with all decks
-        package = genanki.Package(list(self.decks.values()))
-        package.media_files = self.media_files
+        package = genanki.Package(decks)
+        package.media_files = list(self.media_files)
         package.write_to_file(output_path)
-        print(f"Exported deck to: {output_path}")
+        logger.info("Exported deck to: %s", output_path)
         return output_path
 
 
@@ -2815,6 +3670,11 @@ hr {
 class JapaneseVocabPipeline:
     """Main pipeline to generate Anki deck"""
 
+    TTS_LINGER = 0.2  # seconds the consumer waits to fill a batch
+    JOURNAL_FSYNC_EVERY = 100  # checkpoint journal lines between fsyncs
+    # Entry fields left out of the checkpoint and rebuilt on restore
+    REBUILT_FIELDS = ("pitch_svg", "stroke_order_svg")
+
     def __init__(self, epub_path: str, output_dir: str = "./output"):
         self.epub_path = epub_path
         self.output_dir = Path(output_dir)
@@ -2833,15 +3693,36 @@ class JapaneseVocabPipeline:
 
         self.stroke_dir = self.output_dir / "stroke_cache"
         self.stroke_dir.mkdir(exist_ok=True)
+        self._stroke_svgs: Dict[str, str] = {}  # kanji -> SVG, shared by entries
 
-        # Checkpoint file
+        # Cached media: one directory scan each instead of a stat() per lookup
+        self._stroke_cached = self._scan_names(self.stroke_dir)
+        self._words_audio_cached = self._scan_names(self.words_audio_dir)
+        self._ex_audio_cached = self._scan_names(self.examples_audio_dir)
+
+        # Checkpoint: compacted snapshot + append-only journal of new keys
         self.checkpoint_file = self.output_dir / "checkpoint.json"
+        self.journal_file = self.output_dir / "checkpoint.jsonl"
         self.processed: set = set()
+        # key -> {"opts": ..., "entry": {...}} from the last run, for resume;
+        # this run's records stay in the journal until _save_checkpoint
+        self._processed_entries: Dict[str, Dict] = {}
+        self._options_tag = ""  # enrichment options of the current run
+        self._journal = None  # opened lazily in append mode
+        self._journal_lock = threading.Lock()
+        self._journal_unsynced = 0
         self._load_checkpoint()
 
         # Components
         self.parser = EPUBVocabParser(epub_path)
         self.deck_generator = AnkiDeckGenerator("Tiếng Nhật Theo Chủ Đề")
+        # The audio name sets are updated as clips are synthesized
+        self.deck_generator.register_media_dir(
+            self.words_audio_dir, self._words_audio_cached
+        )
+        self.deck_generator.register_media_dir(
+            self.examples_audio_dir, self._ex_audio_cached
+        )
 
         # Stats
         self.stats = {
@@ -2857,10 +3738,99 @@ class JapaneseVocabPipeline:
             "hanviet_found": 0,
             "chiettu_found": 0,
             "skipped_cached": 0,
+            "duplicate_entries_skipped": 0,
         }
+        self._stats_lock = threading.Lock()
+
+        # Pending TTS: output path -> text, and the entries that use each path
+        self._tts_stream: "queue.Queue" = queue.Queue()  # (text, path) | None
+        self._tts_users: Dict[str, List[Tuple[VocabEntry, str]]] = {}
+        self._tts_results: Dict[str, bool] = {}
+        self._tts_thread: Optional[threading.Thread] = None
+        self._tts_lock = threading.Lock()
+
+    def _count(self, key: str, n: int = 1):
+        """Increment a stats counter (called from enrichment worker threads)"""
+        with self._stats_lock:
+            self.stats[key] += n
+
+    def _queue_tts(self, text: str, path: str, entry: VocabEntry, kind: str):
+        """Queue a clip for background synthesis. kind is "word" or "example"."""
+        with self._tts_lock:
+            users = self._tts_users.setdefault(path, [])
+            users.append((entry, kind))
+            if len(users) == 1:
+                self._tts_stream.put((text, path))
+
+    def _start_tts_worker(self):
+        """Start the consumer that synthesizes clips while enrichment runs"""
+        self._tts_thread = threading.Thread(target=self._tts_worker, daemon=True)
+        self._tts_thread.start()
+
+    def _tts_worker(self):
+        import asyncio
+
+        # One event loop for the whole run instead of one asyncio.run per batch
+        loop = asyncio.new_event_loop()
+        try:
+            done = False
+            while not done:
+                batch = [self._tts_stream.get()]
+                while len(batch) < TTSGenerator.BATCH_SIZE:
+                    try:
+                        batch.append(self._tts_stream.get(timeout=self.TTS_LINGER))
+                    except queue.Empty:
+                        break
+                items = [item for item in batch if item is not None]
+                done = len(items) < len(batch)  # None = no more producers
+                if items:
+                    results = TTSGenerator.generate_audio_batch(items, loop)
+                    self._tts_results.update(zip((p for _, p in items), results))
+        finally:
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    def _synthesize_queued_audio(self):
+        """Wait for the consumer to drain; drop references to failed clips"""
+        if self._tts_thread is None:
+            return
+
+        if self._tts_users:
+            logger.info("\n  Finishing audio: %d clips...", len(self._tts_users))
+        self._tts_stream.put(None)
+        self._tts_thread.join()
+        self._tts_thread = None
+
+        for path, users in self._tts_users.items():
+            if self._tts_results.get(path):
+                kind = users[0][1]
+                cached = (
+                    self._words_audio_cached
+                    if kind == "word"
+                    else self._ex_audio_cached
+                )
+                cached.add(Path(path).name)
+                self._count(
+                    "audio_generated" if kind == "word" else "example_audio_generated"
+                )
+                continue
+            for entry, kind in users:
+                if kind == "word":
+                    entry.audio_file = ""
+                else:
+                    entry.examples = entry.examples.replace(
+                        f" [sound:{Path(path).name}]", ""
+                    )
+
+        self._tts_users.clear()
+        self._tts_results.clear()
 
     def _migrate_old_audio(self):
         """Migrate old audio files from audio/ root to audio/words/"""
+        # Already migrated on an earlier run: one lazy probe, no full scan
+        if next(self.audio_dir.glob("*.mp3"), None) is None:
+            return
+
         import shutil
 
         migrated = 0
@@ -2872,39 +3842,182 @@ class JapaneseVocabPipeline:
                     shutil.move(str(mp3_file), str(dest))
                     migrated += 1
         if migrated > 0:
-            print(f"Migrated {migrated} audio files to audio/words/")
+            logger.info("Migrated %d audio files to audio/words/", migrated)
+
+    @staticmethod
+    def _scan_names(directory: Path) -> set:
+        with os.scandir(directory) as it:
+            return {e.name for e in it if e.is_file()}
+
+    def _audio_cached(self, audio_path: Path, cached_names: set) -> bool:
+        """True if the clip is on disk and not still queued for synthesis"""
+        with self._tts_lock:
+            if str(audio_path) in self._tts_users:
+                return False
+        return audio_path.name in cached_names
 
     def _load_checkpoint(self):
-        """Load processed entries from checkpoint"""
+        """Load processed entries from snapshot + journal"""
         if self.checkpoint_file.exists():
             try:
-                with open(self.checkpoint_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(self.checkpoint_file, "rb") as f:
+                    data = _json_loads(f.read())
                     self.processed = set(data.get("processed", []))
-                    print(
-                        f"Loaded checkpoint: {len(self.processed)} entries already processed"
-                    )
+                    self._processed_entries = data.get("entries", {})
             except Exception as e:
-                print(f"Warning: Could not load checkpoint: {e}")
+                logger.warning("Could not load checkpoint: %s", e)
                 self.processed = set()
+                self._processed_entries = {}
+
+        try:
+            self._replay_journal()
+        except Exception as e:
+            logger.warning("Could not load checkpoint journal: %s", e)
+
+        if self.processed:
+            logger.info(
+                "Loaded checkpoint: %d entries already processed", len(self.processed)
+            )
+
+    def _replay_journal(self):
+        """Merge journal records into processed / _processed_entries"""
+        if not self.journal_file.exists():
+            return
+        with open(self.journal_file, "rb") as f:
+            for line in f:
+                try:
+                    record = _json_loads(line)
+                    key = record.pop("key")
+                # AttributeError: a line that parses to a non-object value
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    continue  # partial last line from a crash
+                self.processed.add(key)
+                if "entry" in record:
+                    self._processed_entries[key] = record
+
+    def _mark_processed(self, key: str, entry: VocabEntry):
+        """Journal one enriched entry (thread-safe)"""
+        data = asdict(entry)
+        # Rebuilt from the SVG caches on restore instead of stored inline
+        for name in self.REBUILT_FIELDS:
+            del data[name]
+        record = {"opts": self._options_tag, "entry": data}
+        with self._journal_lock:
+            self.processed.add(key)
+            try:
+                if self._journal is None:
+                    self._journal = open(self.journal_file, "ab")
+                self._journal.write(_json_dumpb({"key": key, **record}) + b"\n")
+                self._journal_unsynced += 1
+                if self._journal_unsynced >= self.JOURNAL_FSYNC_EVERY:
+                    self._journal.flush()
+                    os.fsync(self._journal.fileno())
+                    self._journal_unsynced = 0
+            except Exception as e:
+                logger.warning("Could not write checkpoint journal: %s", e)
+
+    def _restore_entry(self, key: str, entry: VocabEntry) -> bool:
+        """Fill entry from the checkpoint if it was enriched with the same
+        options and all of its audio is still on disk"""
+        record = self._processed_entries.get(key)
+        if not record or record.get("opts") != self._options_tag:
+            return False
+        data = record["entry"]
+
+        audio_file = data.get("audio_file", "")
+        if audio_file and Path(audio_file).name not in self._words_audio_cached:
+            return False
+        for name in re.findall(r"\[sound:([^\]]+)\]", data.get("examples", "")):
+            if name not in self._ex_audio_cached:
+                return False
+
+        # Stroke diagrams come from the SVG caches; a kanji that has never
+        # been fetched successfully (e.g. timed out last run) means re-enrich
+        stroke_svg = ""
+        if self.generate_stroke:
+            stroke_svg = self._rebuild_stroke_svg(data.get("word", ""))
+            if stroke_svg is None:
+                return False
+
+        for name, value in data.items():
+            # Skip per-chapter fields and ones dropped from VocabEntry since
+            if (
+                name in VocabEntry.__slots__
+                and name not in ("chapter", "sub_category")
+                and name not in self.REBUILT_FIELDS
+            ):
+                setattr(entry, name, value)
+
+        entry.stroke_order_svg = stroke_svg
+        if self.generate_pitch:
+            # Morae as get_pitch_pattern gives them: local DB, else the reading
+            hit = PitchAccentAPI.PITCH_DB.get(entry.word)
+            entry.pitch_svg = PitchDiagramGenerator.generate_svg(
+                entry.reading, entry.pitch_pattern, hit[1] if hit else []
+            )
+        return True
+
+    def _local_stroke_svg(self, char: str) -> Optional[str]:
+        """Kanji's SVG from memory or stroke_cache (read at most once per run)"""
+        svg = self._stroke_svgs.get(char)
+        if svg is None:
+            stroke_cache_file = self.stroke_dir / f"{ord(char)}.svg"
+            if stroke_cache_file.name in self._stroke_cached:
+                svg = stroke_cache_file.read_bytes().decode("utf-8")
+                self._stroke_svgs[char] = svg
+        return svg
+
+    def _rebuild_stroke_svg(self, word: str) -> Optional[str]:
+        """Combined stroke SVG of word's kanji from the caches, no network.
+        None if some kanji has no cached answer (never fetched / failed)."""
+        stroke_svgs = []
+        for char in dict.fromkeys(_KANJI_RE.findall(word)):
+            svg = self._local_stroke_svg(char)
+            if svg is None:
+                if self.offline:
+                    continue  # enrichment doesn't look further offline either
+                svg = StrokeOrderAPI.get_cached_svg(char)
+                if svg is None:
+                    return None
+            if svg:
+                stroke_svgs.append(svg)
+        return "".join(stroke_svgs)
+
+    def _close_journal(self):
+        with self._journal_lock:
+            if self._journal is not None:
+                try:
+                    self._journal.close()
+                except:
+                    pass
+                self._journal = None
+                self._journal_unsynced = 0
 
     def _save_checkpoint(self):
-        """Save checkpoint to file"""
+        """Compact journal into the snapshot (atomic replace)"""
+        self._close_journal()
+        tmp_file = self.checkpoint_file.with_suffix(".json.tmp")
         try:
-            with open(self.checkpoint_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    {
-                        "processed": list(self.processed),
-                        "epub": self.epub_path,
-                    },
-                    f,
-                    ensure_ascii=False,
-                    indent=2,
+            # This run's records were only journaled; fold them in now
+            self._replay_journal()
+            with open(tmp_file, "wb") as f:
+                f.write(
+                    _json_dumpb(
+                        {
+                            "processed": sorted(self.processed),
+                            "entries": self._processed_entries,
+                            "epub": self.epub_path,
+                        }
+                    )
                 )
-            # Also save RadicalDB jamdict cache
-            RadicalDB._save_cache()
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.checkpoint_file)
+            # The journal is now part of the snapshot
+            if self.journal_file.exists():
+                self.journal_file.unlink()
         except Exception as e:
-            print(f"Warning: Could not save checkpoint: {e}")
+            logger.warning("Could not save checkpoint: %s", e)
 
     def _get_entry_key(self, entry: VocabEntry, chapter: str = "") -> str:
         """Generate unique key for an entry"""
@@ -2912,10 +4025,13 @@ class JapaneseVocabPipeline:
 
     def clear_checkpoint(self):
         """Clear checkpoint to start fresh"""
-        if self.checkpoint_file.exists():
-            self.checkpoint_file.unlink()
+        self._close_journal()
+        for path in (self.checkpoint_file, self.journal_file):
+            if path.exists():
+                path.unlink()
         self.processed = set()
-        print("Checkpoint cleared")
+        self._processed_entries = {}
+        logger.info("Checkpoint cleared")
 
     def run(
         self,
@@ -2928,82 +4044,203 @@ class JapaneseVocabPipeline:
         force_restart: bool = False,
         offline: bool = False,
         verbose: bool = False,
+        max_workers: int = 16,
     ):
         """Run the full pipeline"""
 
         self.offline = offline
-        self._last_api_called = False
         self.verbose = verbose
+        self.generate_pitch = generate_pitch
+        self.generate_stroke = generate_stroke
         self.generate_example = generate_example
 
         if force_restart:
             self.clear_checkpoint()
 
-        print("=" * 60)
-        print("JAPANESE VOCABULARY ANKI DECK GENERATOR")
-        print("=" * 60)
+        logger.info("=" * 60 + "\nJAPANESE VOCABULARY ANKI DECK GENERATOR\n" + "=" * 60)
         if offline:
-            print("[MODE] Offline - no API calls")
+            logger.info("[MODE] Offline - no API calls")
         if verbose:
-            print("[MODE] Verbose output enabled")
+            logger.info("[MODE] Verbose output enabled")
 
         # Phase 1: Parse EPUB
-        print("\n[Phase 1] Parsing EPUB...")
+        logger.info("\n[Phase 1] Parsing EPUB...")
         chapters = self.parser.parse()
         self.stats["chapters"] = len(chapters)
-        print(f"Found {len(chapters)} chapters")
+        logger.info("Found %d chapters", len(chapters))
 
         # Phase 2: Enrich and generate
-        print("\n[Phase 2] Enriching vocabulary...")
+        logger.info("\n[Phase 2] Enriching vocabulary...")
+
+        # Load local databases up front so worker threads never race the
+        # lazy _load() guards; feature-only DBs are skipped when disabled
+        for db, needed in (
+            (HanVietDB, True),
+            (RadicalDB, True),
+            (KanjiFrequencyDB, True),
+            (JLPTDB, True),
+            (KanjiDB, True),
+            (PitchAccentAPI, generate_pitch),
+            (ExampleSentencesDB, generate_example),
+        ):
+            if needed:
+                db._load()
+        # Same for pykakasi, whose lazy init would otherwise warn per thread
+        FuriganaGenerator._init_kakasi()
+        SentenceFuriganaGenerator._init_kakasi()
+
+        # Radicals need jamdict (sqlite, serialized by a lock): resolve every
+        # kanji once here instead of contending for it from the workers.
+        # The JSON-backed DBs above are already plain in-memory dicts.
+        all_kanji = {
+            char
+            for entries in chapters.values()
+            for entry in entries
+            for char in _KANJI_RE.findall(entry.word)
+        }
+        RadicalDB.prefetch(sorted(all_kanji))
 
-        for chapter_name, entries in chapters.items():
-            print(f"\n  Processing: {chapter_name} ({len(entries)} words)")
+        # Cached Jisho payloads: a few bulk SELECTs instead of one per word
+        JishoAPI.preload(
+            entry.word for entries in chapters.values() for entry in entries
+        )
 
-            for i, entry in enumerate(entries):
-                self.stats["total_words"] += 1
+        # Rate limiting: per-host token buckets, only consumed by real requests
+        RateLimiter.configure(rate_limit_delay)
 
-                # Progress indicator
-                if (i + 1) % 20 == 0:
-                    print(f"    {i + 1}/{len(entries)} processed...")
+        # Stroke order: each kanji missing from stroke_cache fetched once, up
+        # front and concurrently, instead of possibly once per worker
+        if generate_stroke and not offline:
+            StrokeOrderAPI.prefetch(
+                char
+                for char in sorted(all_kanji)
+                if f"{ord(char)}.svg" not in self._stroke_cached
+            )
 
-                # Enrich entry (individual APIs have their own cache)
-                self._enrich_entry(
-                    entry,
-                    enrich_english=enrich_english,
-                    generate_audio=generate_audio,
-                    generate_pitch=generate_pitch,
-                    generate_stroke=generate_stroke,
-                )
+        # Checkpointed entries are only reused under the same options
+        self._options_tag = ",".join(
+            name
+            for name, enabled in (
+                ("en", enrich_english),
+                ("audio", generate_audio),
+                ("pitch", generate_pitch),
+                ("stroke", generate_stroke),
+                ("example", generate_example),
+                ("offline", offline),
+            )
+            if enabled
+        )
 
-                # Add to deck
-                self.deck_generator.add_entry(entry, chapter_name)
+        # Audio is synthesized in the background as entries queue it
+        if generate_audio and not offline:
+            self._start_tts_worker()
+
+        def _process(entry: VocabEntry):
+            # Enrich entry (individual APIs have their own cache)
+            self._enrich_entry(
+                entry,
+                enrich_english=enrich_english,
+                generate_audio=generate_audio,
+                generate_pitch=generate_pitch,
+                generate_stroke=generate_stroke,
+            )
+
+        # Same word/reading/meaning in several chapters is enriched once;
+        # keys come from the parsed entry (enrichment may fix up the reading)
+        unique: Dict[str, VocabEntry] = {}
+        deck_slots = []  # (key, entry, chapter) in EPUB order
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for chapter_name, entries in chapters.items():
+                logger.info("\n  Processing: %s (%d words)", chapter_name, len(entries))
+                self.stats["total_words"] += len(entries)
+
+                # Local/cached examples for the whole chapter in one sweep
+                if generate_example:
+                    ExampleSentencesDB.get_examples_bulk(
+                        [entry.word for entry in entries], limit=2
+                    )
+
+                futures = {}  # future -> (key, entry)
+                for entry in entries:
+                    key = self._get_entry_key(entry)
+                    deck_slots.append((key, entry, chapter_name))
+                    if key in unique:
+                        self.stats["duplicate_entries_skipped"] += 1
+                        continue
+                    unique[key] = entry
+                    # Resume: O(1) checkpoint hit, reuse the stored enrichment
+                    if key in self.processed and self._restore_entry(key, entry):
+                        self.stats["skipped_cached"] += 1
+                        continue
+                    futures[executor.submit(_process, entry)] = (key, entry)
+
+                for i, future in enumerate(as_completed(futures)):
+                    future.result()
+                    # Checkpoint journal is written from this thread only
+                    self._mark_processed(*futures[future])
+                    # Progress indicator
+                    if (i + 1) % 20 == 0:
+                        logger.info("    %d/%d processed...", i + 1, len(futures))
+
+        # Wait for background audio before building notes
+        self._synthesize_queued_audio()
+
+        # deck_slots references every entry now; drop the parser's lists
+        chapters.clear()
+
+        # Fan enriched entries back out (duplicates keep their own chapter),
+        # streamed straight into the per-chapter note builders. Slots are
+        # popped as they are handed over and an enriched entry is dropped
+        # from `unique` after its last slot, so built chapters can be freed.
+        def _deck_entries():
+            slots_left = collections.Counter(key for key, _, _ in deck_slots)
+            deck_slots.reverse()
+            while deck_slots:
+                key, entry, chapter_name = deck_slots.pop()
+                slots_left[key] -= 1
+                enriched = unique.pop(key) if not slots_left[key] else unique[key]
+                if enriched is not entry:
+                    entry = replace(
+                        enriched,
+                        chapter=entry.chapter,
+                        sub_category=entry.sub_category,
+                    )
+                yield entry, chapter_name
 
-                # Rate limiting only when API was actually called
-                if self._last_api_called:
-                    time.sleep(rate_limit_delay)
+        self.deck_generator.add_entries_bulk(_deck_entries())
 
         # Phase 3: Export
-        print("\n[Phase 3] Exporting Anki deck...")
+        logger.info("\n[Phase 3] Exporting Anki deck...")
         output_path = self.output_dir / "japanese_vocabulary.apkg"
         self.deck_generator.export(str(output_path))
-
-        # Print stats
-        print("\n" + "=" * 60)
-        print("GENERATION COMPLETE")
-        print("=" * 60)
-        print(f"Total chapters: {self.stats['chapters']}")
-        print(f"Total words processed: {self.stats['total_words']}")
-        print(f"Word audio generated: {self.stats['audio_generated']}")
-        print(f"Word audio cached: {self.stats['audio_cached']}")
-        print(f"Example audio generated: {self.stats['example_audio_generated']}")
-        print(f"Example audio cached: {self.stats['example_audio_cached']}")
-        print(f"Stroke generated: {self.stats['stroke_generated']}")
-        print(f"Stroke cached (skipped): {self.stats['stroke_cached']}")
-        print(f"Pitch patterns found: {self.stats['pitch_found']}")
-        print(f"Hán Việt found: {self.stats['hanviet_found']}")
-        print(f"Chiết tự found: {self.stats['chiettu_found']}")
-        print(f"\nOutput: {output_path}")
-        print(f"Checkpoint: {self.checkpoint_file}")
+        self._save_checkpoint()
+
+        # Print stats (one write)
+        stats = self.stats
+        logger.info(
+            "\n".join(
+                [
+                    "\n" + "=" * 60,
+                    "GENERATION COMPLETE",
+                    "=" * 60,
+                    f"Total chapters: {stats['chapters']}",
+                    f"Total words processed: {stats['total_words']}",
+                    f"Duplicate entries skipped: {stats['duplicate_entries_skipped']}",
+                    f"Resumed from checkpoint: {stats['skipped_cached']}",
+                    f"Word audio generated: {stats['audio_generated']}",
+                    f"Word audio cached: {stats['audio_cached']}",
+                    f"Example audio generated: {stats['example_audio_generated']}",
+                    f"Example audio cached: {stats['example_audio_cached']}",
+                    f"Stroke generated: {stats['stroke_generated']}",
+                    f"Stroke cached (skipped): {stats['stroke_cached']}",
+                    f"Pitch patterns found: {stats['pitch_found']}",
+                    f"Hán Việt found: {stats['hanviet_found']}",
+                    f"Chiết tự found: {stats['chiettu_found']}",
+                    f"\nOutput: {output_path}",
+                    f"Checkpoint: {self.checkpoint_file}",
+                ]
+            )
+        )
 
         return str(output_path)
 
@@ -3014,16 +4251,20 @@ class JapaneseVocabPipeline:
         generate_audio: bool,
         generate_pitch: bool,
         generate_stroke: bool,
-    ):
-        """Enrich a single vocabulary entry"""
+    ) -> List[str]:
+        """Enrich a single vocabulary entry. Returns the APIs that were called."""
 
-        self._last_api_called = False
         api_calls = []
+        log = []  # verbose lines, printed together (entries run concurrently)
         # === VALIDATE READING FROM JISHO ===
-        jisho_reading = JishoAPI.get_reading(entry.word)
+        # One Jisho payload feeds reading, word type and related words
+        jisho = JishoAPI.get_all(entry.word)
+        jisho_reading = jisho["reading"]
         if jisho_reading and jisho_reading != entry.reading:
             if self.verbose:
-                print(f"      [FIX] {entry.word}: {entry.reading} → {jisho_reading}")
+                log.append(
+                    f"      [FIX] {entry.word}: {entry.reading} → {jisho_reading}"
+                )
             entry.reading = jisho_reading
 
         # === VALIDATE READING COMPLETENESS ===
@@ -3033,13 +4274,12 @@ class JapaneseVocabPipeline:
         )
         if validated_reading and validated_reading != entry.reading:
             if self.verbose:
-                print(
+                log.append(
                     f"      [FIX-READING] {entry.word}: {entry.reading} → {validated_reading}"
                 )
             entry.reading = validated_reading
 
-        if self.verbose:
-            print(f"      → {entry.word} ({entry.reading})", end="")
+        summary = f"      → {entry.word} ({entry.reading})"
 
         # Kanji database - full info including chiết tự
         kanji_info = KanjiDB.get_word_info(entry.word)
@@ -3047,16 +4287,18 @@ class JapaneseVocabPipeline:
         # Hán Việt from kanji_info
         if kanji_info["han_viet"]:
             entry.han_viet = " ".join(kanji_info["han_viet"])
-            self.stats["hanviet_found"] += 1
+            self._count("hanviet_found")
 
         # Pinyin
         if kanji_info["pinyin"]:
             entry.kanji_pinyin = ", ".join(kanji_info["pinyin"])
 
+        # Kanji in the word, in order, each once
+        unique_kanji = list(dict.fromkeys(_KANJI_RE.findall(entry.word)))
+
         # Kun/On readings - ưu tiên KanjiAPI, fallback local
-        first_kanji = next((c for c in entry.word if "\u4e00" <= c <= "\u9fff"), None)
-        if first_kanji:
-            kun_api, on_api = KanjiAPI.get_readings(first_kanji)
+        if unique_kanji:
+            kun_api, on_api = KanjiAPI.get_readings(unique_kanji[0])
             if kun_api or on_api:
                 if kun_api:
                     entry.kanji_kun = " | ".join(kun_api)
@@ -3071,15 +4313,18 @@ class JapaneseVocabPipeline:
 
         # Từ ghép (compound words)
         if kanji_info["tu_ghep"]:
+            tu_ghep = kanji_info["tu_ghep"][:4]
+            # Add furigana to all Japanese parts in one batch
+            han_ruby = iter(
+                SentenceFuriganaGenerator.generate_batch(
+                    [tg.get("han", "") for tg in tu_ghep if isinstance(tg, dict)]
+                )
+            )
             tu_ghep_html = []
-            for tg in kanji_info["tu_ghep"][:4]:
+            for tg in tu_ghep:
                 if isinstance(tg, dict):
-                    han_part = tg.get("han", "")
                     viet_part = tg.get("viet", "")
-                    # Add furigana to Japanese part
-                    han_with_ruby = (
-                        SentenceFuriganaGenerator.generate(han_part) if han_part else ""
-                    )
+                    han_with_ruby = next(han_ruby)
                     tu_ghep_html.append(f"{viet_part} {han_with_ruby}")
                 else:
                     tu_ghep_html.append(str(tg))
@@ -3088,50 +4333,48 @@ class JapaneseVocabPipeline:
         # Chi tiết chiết tự
         if kanji_info["chi_tiet"]:
             entry.kanji_chi_tiet = "<br><br>".join(kanji_info["chi_tiet"][:2])
-            self.stats["chiettu_found"] += 1
+            self._count("chiettu_found")
 
         # Radical info - collect ALL component radicals from each kanji
         radical_parts = []
         seen_radicals = set()
-        for char in entry.word:
-            if "\u4e00" <= char <= "\u9fff":  # Is kanji
-                # Get all radicals for this kanji
-                all_radicals = RadicalDB.identify_all_radicals(char)
-                for radical_info in all_radicals:
-                    if radical_info and radical_info.get("symbol") not in seen_radicals:
-                        seen_radicals.add(radical_info.get("symbol"))
-                        # Format: 心 (忄) • tim, tâm [⭐ Thiết yếu]
-                        rad_symbol = radical_info.get("symbol", "")
-                        found_as = radical_info.get("found_as", "")
-                        meaning_vn = radical_info.get("meaning_vn", "")
-                        freq = radical_info.get("frequency", 0)
-                        joyo = radical_info.get("joyo_freq", 0)
-                        importance = RadicalDB.get_importance_label(freq, joyo)
-
-                        # Show variant if different from main symbol
-                        if found_as and found_as != rad_symbol:
-                            radical_parts.append(
-                                f"{rad_symbol} ({found_as}) • {meaning_vn} [{importance}]"
-                            )
-                        else:
-                            radical_parts.append(
-                                f"{rad_symbol} • {meaning_vn} [{importance}]"
-                            )
+        for char in unique_kanji:
+            # Get all radicals for this kanji
+            all_radicals = RadicalDB.identify_all_radicals(char)
+            for radical_info in all_radicals:
+                if radical_info and radical_info.get("symbol") not in seen_radicals:
+                    seen_radicals.add(radical_info.get("symbol"))
+                    # Format: 心 (忄) • tim, tâm [⭐ Thiết yếu]
+                    rad_symbol = radical_info.get("symbol", "")
+                    found_as = radical_info.get("found_as", "")
+                    meaning_vn = radical_info.get("meaning_vn", "")
+                    freq = radical_info.get("frequency", 0)
+                    joyo = radical_info.get("joyo_freq", 0)
+                    importance = RadicalDB.get_importance_label(freq, joyo)
+
+                    # Show variant if different from main symbol
+                    if found_as and found_as != rad_symbol:
+                        radical_parts.append(
+                            f"{rad_symbol} ({found_as}) • {meaning_vn} [{importance}]"
+                        )
+                    else:
+                        radical_parts.append(
+                            f"{rad_symbol} • {meaning_vn} [{importance}]"
+                        )
 
         if radical_parts:
             entry.radical_info = " | ".join(radical_parts)  # Show all radicals
 
         # Frequency info - handle compound words (each kanji)
         freq_parts = []
-        for char in entry.word:
-            if "\u4e00" <= char <= "\u9fff":  # Is kanji
-                freq = KanjiFrequencyDB.get_frequency(char)
-                if freq:
-                    tier = freq["tier"]
-                    rank = freq["rank"]
-                    freq_parts.append(
-                        f'<span class="freq-{tier}">{char} [{tier} #{rank}]</span>'
-                    )
+        for char in unique_kanji:
+            freq = KanjiFrequencyDB.get_frequency(char)
+            if freq:
+                tier = freq["tier"]
+                rank = freq["rank"]
+                freq_parts.append(
+                    f'<span class="freq-{tier}">{char} [{tier} #{rank}]</span>'
+                )
         if freq_parts:
             entry.frequency_info = " ".join(freq_parts)
 
@@ -3147,10 +4390,10 @@ class JapaneseVocabPipeline:
         entry.furigana = FuriganaGenerator.generate(entry.word, entry.reading)
 
         # Word type - from cached Jisho data, O(1) if cached
-        entry.word_type = JishoAPI.get_word_type(entry.word)
+        entry.word_type = jisho["word_type"]
 
         # Synonyms/Antonyms - from cached Jisho data, O(1) if cached
-        entry.synonyms, entry.antonyms = JishoAPI.get_synonyms_antonyms(entry.word)
+        entry.synonyms, entry.antonyms = jisho["synonyms"], jisho["antonyms"]
 
         # Verb conjugation - O(1) pattern matching
         if entry.word_type and (
@@ -3167,20 +4410,18 @@ class JapaneseVocabPipeline:
             examples = ExampleSentencesDB.get_examples(
                 entry.word, limit=2, offline=self.offline
             )
-            if ExampleSentencesDB.last_api_called:
-                self._last_api_called = True
+            if ExampleSentencesDB.was_api_called():
                 api_calls.append("EX")
             if examples:
                 import re
 
                 examples_final = []
-                example_audio_generated = False
+                example_audio_queued = False
 
                 for i, ex in enumerate(examples):
-                    if "→" in ex:
-                        jp_part, vi_part = ex.split("→", 1)
-                        jp_part = jp_part.strip()
-                        vi_part = vi_part.strip()
+                    parts = _ARROW_RE.split(ex.strip(), maxsplit=1)
+                    if len(parts) == 2:
+                        jp_part, vi_part = parts
 
                         # Add furigana
                         jp_with_ruby = SentenceFuriganaGenerator.generate(jp_part)
@@ -3188,22 +4429,19 @@ class JapaneseVocabPipeline:
                         # Generate audio for this sentence (inline at end)
                         audio_tag = ""
                         if generate_audio and not self.offline:
-                            ex_hash = hashlib.md5(
-                                f"{entry.word}_{i}_{jp_part}".encode()
-                            ).hexdigest()[:10]
-                            ex_audio_filename = f"ex_{ex_hash}.mp3"
+                            ex_key = f"{entry.word}_{i}_{jp_part}"
+                            ex_audio_filename = f"ex_{_short_hash(ex_key, 10)}.mp3"
                             ex_audio_path = self.examples_audio_dir / ex_audio_filename
 
-                            if ex_audio_path.exists():
-                                audio_tag = f" [sound:{ex_audio_filename}]"
-                                self.stats["example_audio_cached"] += 1
+                            audio_tag = f" [sound:{ex_audio_filename}]"
+                            if self._audio_cached(ex_audio_path, self._ex_audio_cached):
+                                self._count("example_audio_cached")
                             else:
-                                if TTSGenerator.generate_audio(
-                                    jp_part, str(ex_audio_path)
-                                ):
-                                    audio_tag = f" [sound:{ex_audio_filename}]"
-                                    self.stats["example_audio_generated"] += 1
-                                    example_audio_generated = True
+                                # Synthesized in batch after enrichment
+                                self._queue_tts(
+                                    jp_part, str(ex_audio_path), entry, "example"
+                                )
+                                example_audio_queued = True
 
                         # Combine: Japanese (with ruby) → Vietnamese [audio]
                         examples_final.append(f"{jp_with_ruby} → {vi_part}{audio_tag}")
@@ -3212,16 +4450,14 @@ class JapaneseVocabPipeline:
 
                 entry.examples = "<br>".join(examples_final)
 
-                if example_audio_generated:
-                    self._last_api_called = True
+                if example_audio_queued:
                     api_calls.append("EX_AUDIO")
 
         # English meaning (API call) - skip in offline mode
         if enrich_english and not self.offline:
             try:
                 entry.meaning_en = JishoAPI.get_english_meaning(entry.word)
-                if JishoAPI.last_api_called:
-                    self._last_api_called = True
+                if JishoAPI.was_api_called():
                     api_calls.append("EN")
             except:
                 pass
@@ -3231,12 +4467,11 @@ class JapaneseVocabPipeline:
             pattern, morae = PitchAccentAPI.get_pitch_pattern(
                 entry.word, entry.reading, offline=self.offline
             )
-            if PitchAccentAPI.last_api_called:
-                self._last_api_called = True
+            if PitchAccentAPI.was_api_called():
                 api_calls.append("PITCH")
             entry.pitch_pattern = pattern
             if pattern != "?":
-                self.stats["pitch_found"] += 1
+                self._count("pitch_found")
             entry.pitch_svg = PitchDiagramGenerator.generate_svg(
                 entry.reading, pattern, morae
             )
@@ -3245,28 +4480,25 @@ class JapaneseVocabPipeline:
         if generate_stroke:
             stroke_svgs = []
             stroke_api_called = False
-            for char in entry.word:
-                # Skip non-kanji (hiragana, katakana, punctuation)
-                if not ("\u4e00" <= char <= "\u9fff"):
-                    continue
-
+            for char in unique_kanji:
                 stroke_cache_file = self.stroke_dir / f"{ord(char)}.svg"
 
-                if stroke_cache_file.exists():
-                    # Load from cache
-                    svg = stroke_cache_file.read_text(encoding="utf-8")
+                # Each kanji's SVG is read from disk at most once per run
+                svg = self._local_stroke_svg(char)
+                if svg is not None:
                     stroke_svgs.append(svg)
-                    self.stats["stroke_cached"] += 1
+                    self._count("stroke_cached")
                 elif not self.offline:
                     try:
-                        self._last_api_called = True
                         stroke_api_called = True
                         svg = StrokeOrderAPI.get_stroke_order_svg(char)
                         if svg:
                             stroke_svgs.append(svg)
+                            self._stroke_svgs[char] = svg
                             # Save to cache
-                            stroke_cache_file.write_text(svg, encoding="utf-8")
-                            self.stats["stroke_generated"] += 1
+                            stroke_cache_file.write_bytes(svg.encode("utf-8"))
+                            self._stroke_cached.add(stroke_cache_file.name)
+                            self._count("stroke_generated")
                     except:
                         pass
 
@@ -3279,24 +4511,23 @@ class JapaneseVocabPipeline:
 
         # Audio for word - check if already exists
         if generate_audio:
-            audio_filename = f"{hashlib.md5(entry.word.encode()).hexdigest()[:8]}.mp3"
+            audio_filename = f"{_short_hash(entry.word, 8)}.mp3"
             audio_path = self.words_audio_dir / audio_filename
 
-            if audio_path.exists():
+            if self._audio_cached(audio_path, self._words_audio_cached):
                 # Audio already exists, skip generation
                 entry.audio_file = str(audio_path)
-                self.stats["audio_cached"] += 1
+                self._count("audio_cached")
             elif not self.offline:
-                self._last_api_called = True
+                # Synthesized in batch after enrichment
                 api_calls.append("AUDIO")
-                if TTSGenerator.generate_audio(entry.word, str(audio_path)):
-                    entry.audio_file = str(audio_path)
-                    self.stats["audio_generated"] += 1
+                self._queue_tts(entry.word, str(audio_path), entry, "word")
+                entry.audio_file = str(audio_path)
 
         # Debug: show which APIs were called
         if self.verbose:
             if api_calls:
-                print(f" [API: {','.join(api_calls)}]")
+                log.append(f"{summary} [API: {','.join(api_calls)}]")
             else:
                 # Show cached details
                 cached_items = []
@@ -3308,7 +4539,12 @@ class JapaneseVocabPipeline:
                     cached_items.append("pitch")
                 if entry.examples:
                     cached_items.append("ex")
-                print(f" [cached: {','.join(cached_items) if cached_items else 'all'}]")
+                log.append(
+                    f"{summary} [cached: {','.join(cached_items) if cached_items else 'all'}]"
+                )
+            logger.debug("\n".join(log))
+
+        return api_calls
 
 
 # =============================================================================
@@ -3335,7 +4571,10 @@ def main():
         "--no-example", action="store_true", help="Skip example sentences"
     )
     parser.add_argument(
-        "--delay", type=float, default=0.5, help="API rate limit delay (seconds)"
+        "--delay",
+        type=float,
+        default=0.5,
+        help="Min seconds between requests to the same API host",
     )
     parser.add_argument(
         "--force-restart", action="store_true", help="Clear checkpoint and start fresh"
@@ -3346,9 +4585,16 @@ def main():
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Print detailed progress"
     )
+    parser.add_argument(
+        "--workers", type=int, default=16, help="Parallel enrichment threads"
+    )
 
     args = parser.parse_args()
 
+    # Console output: progress at INFO, per-entry details at DEBUG (-v)
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
     pipeline = JapaneseVocabPipeline(args.epub_path, args.output)
     pipeline.run(
         enrich_english=not args.no_english,
@@ -3360,6 +4606,7 @@ def main():
         force_restart=args.force_restart,
         offline=args.offline,
         verbose=args.verbose,
+        max_workers=args.workers,
     )
 
 